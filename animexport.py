@@ -0,0 +1,238 @@
+import argparse
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import matplotlib
+matplotlib.use("Agg")        # offscreen: no display needed
+import matplotlib.pyplot as plt
+import numpy as np
+from PIL import Image            # Pillow ships with matplotlib
+
+import pimonte_matplot
+import pinewton
+
+# Headless, parallel frame export for the matplotlib animations
+# -------------------------------------------------------------
+# A scene is a build function returning (fig, update, frames), where
+# update(i) draws frame i and must be called in order.  The frame range is
+# cut into one contiguous slice per worker; each worker builds its own
+# figure, fast-forwards the (cheap) state updates up to its slice without
+# drawing, then draws and writes its frames as PNGs.  Drawing is blitted
+# like FuncAnimation(blit=True): the artists update() returns are drawn over
+# a cached background, which is re-rendered only when that set changes.
+# The PNG sequence is assembled with a local ffmpeg if there is one (MP4, or
+# GIF through palettegen/paletteuse); without ffmpeg a GIF is written with
+# Pillow, the frames decoded and quantized across the same pool, and
+# anything else stays a PNG sequence.  Stochastic scenes need a fixed seed so the slices agree.
+
+# python animexport.py pinewton --out pinewton.gif --fps 1
+# python animexport.py pimonte --points 200000 --out pimonte.mp4 --workers 4
+
+# Scene name -> (build function, keyword arguments from the CLI)
+SCENES = {
+    "pinewton": (pinewton.build_animation,
+                 lambda a: {"x0": a.x0, "max_iter": a.max_iter}),
+    "pimonte":  (pimonte_matplot.build_animation,
+                 lambda a: {"n_points": a.points, "seed": a.seed}),
+}
+
+FRAME_NAME = "frame_%05d.png"
+
+
+class BlitRenderer:
+    """Draws frames as a cached background plus the animated artists."""
+
+    def __init__(self, fig):
+        self.fig = fig
+        self.canvas = fig.canvas
+        self.animated = []
+        self.background = None
+
+    def draw(self, artists):
+        artists = list(artists or [])
+        if [id(a) for a in artists] != [id(a) for a in self.animated]:
+            # New artist set: old ones become part of the background
+            for a in self.animated:
+                a.set_animated(False)
+            for a in artists:
+                a.set_animated(True)
+            self.animated = artists
+            self.canvas.draw()
+            self.background = self.canvas.copy_from_bbox(self.fig.bbox)
+        else:
+            self.canvas.restore_region(self.background)
+        for a in self.animated:
+            self.fig.draw_artist(a)
+        return np.asarray(self.canvas.buffer_rgba())[..., :3]
+
+
+def render_range(build, kwargs, start, stop, outdir, dpi=None):
+    """Worker entry point: write frames [start, stop) as PNGs.
+
+    Returns the number of frames written.
+    """
+    fig, update, frames = build(**kwargs)
+    stop = min(stop, frames)
+    if dpi:
+        fig.set_dpi(dpi)
+    renderer = BlitRenderer(fig)
+    for i in range(stop):
+        artists = update(i)
+        if i >= start:
+            # Fast PNG compression; these are intermediate files
+            Image.fromarray(renderer.draw(artists)).save(
+                os.path.join(outdir, FRAME_NAME % i), compress_level=1)
+    plt.close(fig)
+    return max(0, stop - start)
+
+
+def count_frames(build, kwargs):
+    fig, _, frames = build(**kwargs)
+    plt.close(fig)
+    return frames
+
+
+def render_frames(build, kwargs, outdir, workers=None, dpi=None):
+    """Render every frame of a scene into outdir across a process pool."""
+    frames = count_frames(build, kwargs)
+    workers = max(1, min(workers or os.cpu_count() or 1, frames))
+    step = -(-frames // workers)
+    ranges = [(lo, min(lo + step, frames)) for lo in range(0, frames, step)]
+    if workers == 1:
+        return sum(render_range(build, kwargs, lo, hi, outdir, dpi) for lo, hi in ranges)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(render_range, build, kwargs, lo, hi, outdir, dpi) for lo, hi in ranges]
+        return sum(f.result() for f in futures)
+
+
+def quantize_frame(path, palette):
+    """Worker entry point: one PNG frame mapped onto the shared GIF palette."""
+    return Image.open(path).convert("RGB").quantize(palette=palette, dither=Image.Dither.NONE)
+
+
+def transparent_deltas(frames, transparent):
+    """Mark pixels equal to the previous frame as `transparent`.
+
+    With disposal 1 (keep the previous frame) the GIF looks the same, but
+    the unchanged areas become long runs that LZW compresses to almost
+    nothing.  Done in NumPy here instead of Pillow's per-pixel optimizer.
+    """
+    previous = None
+    for im in frames:
+        current = np.asarray(im)
+        if previous is None:
+            yield im
+        else:
+            delta = Image.fromarray(np.where(current == previous, transparent, current).astype(np.uint8), "P")
+            delta.putpalette(im.getpalette())
+            yield delta
+        previous = current
+
+
+def quantized_frames(files, palette, workers):
+    """Yield the quantized frames in order, decoding ahead across a pool.
+
+    At most a few frames per worker are in flight, so memory stays bounded
+    while the (serial) GIF encoder consumes them.
+    """
+    if workers == 1:
+        yield from (quantize_frame(f, palette) for f in files)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for f in files:
+            pending.append(pool.submit(quantize_frame, f, palette))
+            if len(pending) >= 4 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def assemble(frame_dir, out, fps, workers=None):
+    """Turn the PNG sequence into `out`; returns the path actually written."""
+    ext = os.path.splitext(out)[1].lower()
+    ffmpeg = shutil.which("ffmpeg")
+    pattern = os.path.join(frame_dir, FRAME_NAME)
+    if ffmpeg and ext in (".mp4", ".gif"):
+        cmd = [ffmpeg, "-y", "-loglevel", "error", "-framerate", str(fps), "-i", pattern]
+        if ext == ".mp4":
+            # Even dimensions and yuv420p for players that need them
+            cmd += ["-vf", "pad=ceil(iw/2)*2:ceil(ih/2)*2", "-c:v", "libx264", "-pix_fmt", "yuv420p"]
+        else:
+            # One palette for the whole clip; frames store only changed rectangles
+            cmd += ["-filter_complex",
+                    "split[a][b];[a]palettegen=stats_mode=diff[p];[b][p]paletteuse=dither=none:diff_mode=rectangle"]
+        subprocess.run(cmd + [out], check=True)
+        return out
+    if ext == ".gif":
+        files = [os.path.join(frame_dir, f) for f in sorted(os.listdir(frame_dir))]
+        # One shared palette (from the first, middle and last frames) keeps
+        # quantizing cheap and lets the GIF writer store frame differences
+        samples = [Image.open(files[i]).convert("RGB") for i in sorted({0, len(files) // 2, len(files) - 1})]
+        strip = Image.new("RGB", (samples[0].width, samples[0].height * len(samples)))
+        for k, im in enumerate(samples):
+            strip.paste(im, (0, k * im.height))
+        # 255 colours: the last index is kept free for "unchanged" pixels
+        palette = strip.quantize(colors=255, method=Image.Quantize.FASTOCTREE)
+        workers = max(1, min(workers or os.cpu_count() or 1, len(files)))
+        frames = transparent_deltas(quantized_frames(files, palette, workers), 255)
+        first = next(frames)
+        # optimize=False: the deltas are already transparent, so skip
+        # Pillow's own (much slower) per-pixel transparency pass
+        first.save(out, save_all=True, append_images=frames, duration=int(1000 / fps),
+                   loop=0, optimize=False, disposal=1, transparency=255)
+        return out
+    # No encoder: keep the frames next to the requested output
+    seq_dir = os.path.splitext(out)[0] + "_frames"
+    if os.path.exists(seq_dir):
+        shutil.rmtree(seq_dir)
+    shutil.copytree(frame_dir, seq_dir)
+    return seq_dir
+
+
+def export(scene, out, fps=30, workers=None, dpi=None, **kwargs):
+    """Render a scene offscreen and write it to `out` (.png, .gif or .mp4).
+
+    A .png target (or .mp4 without ffmpeg) produces a directory of frames.
+    Returns (path written, frames, seconds).
+    """
+    build = SCENES[scene][0] if isinstance(scene, str) else scene
+    start = time.perf_counter()
+    with tempfile.TemporaryDirectory() as tmp:
+        frames = render_frames(build, kwargs, tmp, workers, dpi)
+        path = assemble(tmp, out, fps, workers)
+    return path, frames, time.perf_counter() - start
+
+
+def parse_args():
+    p = argparse.ArgumentParser(description="Offscreen parallel export of the matplotlib animations")
+    p.add_argument("scene",       choices=list(SCENES), help="Animation to export")
+    p.add_argument("--out",       default=None, help="Output file: .mp4, .gif or .png (frame sequence)")
+    p.add_argument("--fps",       type=float, default=None, help="Frames per second (default per scene)")
+    p.add_argument("--workers",   type=int,   default=None, help="Worker processes (default: all cores)")
+    p.add_argument("--dpi",       type=float, default=None, help="Figure DPI (default: matplotlib's)")
+    p.add_argument("--points",    type=int,   default=20000, help="pimonte: number of points")
+    p.add_argument("--seed",      type=int,   default=0,     help="pimonte: RNG seed (must be fixed)")
+    p.add_argument("--x0",        type=float, default=3.0,   help="pinewton: starting point")
+    p.add_argument("--max-iter",  type=int,   default=8,     help="pinewton: Newton iterations")
+    return p.parse_args()
+
+
+def main():
+    args = parse_args()
+    build, make_kwargs = SCENES[args.scene]
+    out = args.out or f"{args.scene}.gif"
+    fps = args.fps or (1 if args.scene == "pinewton" else 30)
+    path, frames, seconds = export(build, out, fps, args.workers, args.dpi, **make_kwargs(args))
+    print(f"{frames} frames in {seconds:.2f} s ({frames / seconds:.1f} frames/s) -> {path}")
+    if not shutil.which("ffmpeg") and not out.lower().endswith((".gif", ".png")):
+        print("ffmpeg not found: wrote a PNG sequence instead")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,14 @@ import numpy as np
 import math
 import sys
 
+# python fourier_love2.py                 # bentuk hati bawaan
+# python fourier_love2.py bentuk.svg      # path SVG atau titik x,y dari CSV
+# python fourier_love2.py gambar.png      # kontur gambar PNG
+
+from fourier_epicycles import (fourier_series, chain_xy, pen_trajectory, trajectory_xy,
+                                 truncate, visible_count, Trail)
+from fourier_shapes import load_series
+
 # ── Konfigurasi ─────────────────────────────────────────────────────────────
 LEBAR, TINGGI       = 800, 600
 FPS                  = 10
@@ -12,49 +20,67 @@ SKALA_X              = -1        # flip horizontal (jaga orientasi)
 SKALA_Y              = -1        # flip vertikal (perbaiki orientasi)
 A                    = 15        # skala (zoom) untuk lingkaran epicycle
 MARGIN               = 10        # jarak tepi agar epicycles tidak keluar canvas
+TAMPILKAN_LINGKARAN  = True      # tombol C: tampilkan/sembunyikan epicycle
+ENERGI_MINIMUM       = None      # mis. 0.9999: simpan koefisien secukupnya untuk fraksi energi ini
+GALAT_PIKSEL         = 0.5       # galat pena maksimum (piksel) saat memotong koefisien; None = semua
+RADIUS_MINIMUM       = 1         # lingkaran di bawah ini (piksel) tidak digambar
+PUDAR_JEJAK          = False     # True: jejak memudar menurut umur
+BENTUK               = sys.argv[1] if len(sys.argv) > 1 else None   # file .svg/.csv/.png
 
 # ── Fungsi hati parametris sebagai angka kompleks─────────────────────────────
 def empatier_hati(t):
     x = 16 * np.sin(t)**3
     y = 13*np.cos(t) - 5*np.cos(2*t) - 2*np.cos(3*t) - np.cos(4*t)
-    return complex(x, y)
-
-# ── Sampel titik kurva hati ──────────────────────────────────────────────────
-ts    = np.linspace(0, 2*math.pi, JUMLAH_SAMPEL, endpoint=False)
-pts   = np.array([empatier_hati(t) for t in ts])
+    return x + 1j*y           # bekerja untuk array t sekaligus
 
 # ── Hitung DFT dan koefisien Fourier───────────────────────────────────────────
-coeffs = np.fft.fft(pts) / JUMLAH_SAMPEL
-freqs  = np.fft.fftfreq(JUMLAH_SAMPEL, d=1/JUMLAH_SAMPEL)
-
-koefisien_fourier = [(f, abs(c), np.angle(c)) for f, c in zip(freqs, coeffs)]
 # urutkan berdasarkan amplitudo menurun
-koefisien_fourier.sort(key=lambda x: x[1], reverse=True)
+if BENTUK:
+    # bentuk dari file: diresample per panjang busur, koefisien di-cache (.npz)
+    frekuensi, koefisien = load_series(BENTUK, JUMLAH_SAMPEL)
+else:
+    ts    = np.linspace(0, 2*math.pi, JUMLAH_SAMPEL, endpoint=False)
+    frekuensi, koefisien = fourier_series(empatier_hati(ts))
+
+# ── Potong koefisien: prefiks terpendek yang memenuhi energi / galat piksel ────
+SKALA_PIKSEL = A * max(abs(SKALA_X), abs(SKALA_Y))
+frekuensi, koefisien = truncate(frekuensi, koefisien, ENERGI_MINIMUM,
+                                None if GALAT_PIKSEL is None else GALAT_PIKSEL / SKALA_PIKSEL)
+# lingkaran sub-piksel tidak digambar; geserannya tetap ada di lintasan pena
+JUMLAH_TERLIHAT = visible_count(koefisien, SKALA_PIKSEL, RADIUS_MINIMUM)
+frek_terlihat, koef_terlihat = frekuensi[:JUMLAH_TERLIHAT], koefisien[:JUMLAH_TERLIHAT]
+jari_jari = (np.abs(koef_terlihat) * A).astype(int).tolist()   # radius lingkaran (piksel)
 
 # ── Hitung penempatan agar tidak overflow─────────────────────────────────────
 # Margin dari tepi
 MARGIN = 10  
 # Penempatan epicycles di kiri
-max_amp = max(amp for _, amp, _ in koefisien_fourier)
+max_amp = np.abs(koefisien).max()
 CENTER_CIRCLES = (int(max_amp * A + MARGIN), TINGGI // 2)
-# Hitung batas x mentah dari fungsi hati
-heart_raw = np.array([empatier_hati(t) for t in ts])
-heart_x   = SKALA_X * heart_raw.real * A
+# Hitung batas x mentah dari lintasan pena (sama dengan kurva sampel)
+LANGKAH_PERIODE = max(1, round(JUMLAH_SAMPEL / SKALA_WAKTU))   # frame per 2π
+lintasan  = pen_trajectory(frekuensi, koefisien, LANGKAH_PERIODE)
+heart_x   = SKALA_X * lintasan.real * A
 # Hitung offset sehingga bentuk hati berada dalam batas dan di samping epicycles
 x_min = heart_x.min()
-offset_x_path = int(-x_min + MARGIN)
+offset_x_path = int(round(-x_min + MARGIN))   # round: lintasan FFT punya galat ~1e-13
 CENTER_PATH    = (offset_x_path, 0)
 
+# ── Lintasan pena satu periode: satu inverse FFT, lalu diambil per indeks ─────
+lintasan_x, lintasan_y = trajectory_xy(lintasan, CENTER_CIRCLES, SKALA_X * A, SKALA_Y * A)
+lintasan_x, lintasan_y = lintasan_x.tolist(), lintasan_y.tolist()
+
 # ── Inisialisasi Pygame ────────────────────────────────────────────────────── ──────────────────────────────────────────────────────
 pygame.init()
 layar = pygame.display.set_mode((LEBAR, TINGGI))
-pygame.display.set_caption("Animasi Fourier: Bentuk Hati – Enter Reset, Space Quit")
+pygame.display.set_caption("Animasi Fourier: Bentuk Hati – Enter Reset, Space Quit, C Lingkaran")
 jam   = pygame.time.Clock()
 
 # ── Status animasi ───────────────────────────────────────────────────────────
-waktu = 0.0
-dt    = (2 * math.pi / JUMLAH_SAMPEL) * SKALA_WAKTU
-jalur = []
+langkah = 0                               # indeks frame dalam satu periode
+dt    = 2 * math.pi / LANGKAH_PERIODE
+jalur = Trail(JUMLAH_SAMPEL)               # ring buffer jejak pena
+tampilkan_lingkaran = TAMPILKAN_LINGKARAN
 
 # ── Loop utama ───────────────────────────────────────────────────────────────
 berjalan = True
@@ -66,34 +92,34 @@ while berjalan:
             if peristiwa.key == pygame.K_SPACE:
                 berjalan = False  # quit
             elif peristiwa.key in (pygame.K_RETURN, pygame.K_KP_ENTER):
-                waktu = 0         # reset
+                langkah = 0       # reset
                 jalur.clear()
+            elif peristiwa.key == pygame.K_c:
+                tampilkan_lingkaran = not tampilkan_lingkaran
 
     layar.fill((30, 30, 30))
 
     # ── Gambar epicycles ─────────────────────────────────────────────────────
-    x0, y0 = CENTER_CIRCLES
-    for frek, amp, fase in koefisien_fourier:
-        x1 = x0 + SKALA_X * amp * math.cos(frek * waktu + fase) * A
-        y1 = y0 + SKALA_Y * amp * math.sin(frek * waktu + fase) * A
-
-        # lingkaran dan vektor
-        pygame.draw.circle(layar, (100, 100, 100), (int(x0), int(y0)), int(amp * A), 1)
-        pygame.draw.line(layar, (200, 200, 200), (int(x0), int(y0)), (int(x1), int(y1)), 2)
-        x0, y0 = x1, y1
+    # ujung pena dari lintasan; sendi rantai hanya dihitung bila lingkaran terlihat
+    x0, y0 = lintasan_x[langkah], lintasan_y[langkah]
+    if tampilkan_lingkaran:
+        xs, ys = chain_xy(frek_terlihat, koef_terlihat, langkah * dt, CENTER_CIRCLES, SKALA_X * A, SKALA_Y * A)
+        sendi = list(zip(xs.astype(int).tolist(), ys.astype(int).tolist()))
+
+        # lingkaran dan vektor (segmen terakhir ke pena = lingkaran sub-piksel)
+        for pusat, r in zip(sendi, jari_jari):
+            pygame.draw.circle(layar, (100, 100, 100), pusat, r, 1)
+        sendi.append((int(x0), int(y0)))
+        pygame.draw.lines(layar, (200, 200, 200), False, sendi, 2)
 
     # ── Rekam dan gambar jejak path───────────────────────────────────────────
-    ujung = (x0 + CENTER_PATH[0], y0 + CENTER_PATH[1])
-    jalur.insert(0, ujung)
-    if len(jalur) > JUMLAH_SAMPEL:
-        jalur.pop()
-    if len(jalur) > 1:
-        pygame.draw.lines(layar, (220, 20, 60), False, jalur, 2)
+    jalur.append(x0 + CENTER_PATH[0], y0 + CENTER_PATH[1])
+    jalur.draw(layar, (220, 20, 60), 2, (30, 30, 30) if PUDAR_JEJAK else None)
 
     # ── Update waktu dan looping ─────────────────────────────────────────────
-    waktu += dt
-    if waktu > 2 * math.pi:
-        waktu = 0
+    langkah += 1
+    if langkah >= LANGKAH_PERIODE:
+        langkah = 0
         jalur.clear()
 
     pygame.display.flip()
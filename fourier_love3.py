@@ -3,6 +3,14 @@ import numpy as np
 import math
 import sys
 
+# python fourier_love3.py                 # bentuk hati bawaan
+# python fourier_love3.py bentuk.svg      # path SVG atau titik x,y dari CSV
+# python fourier_love3.py gambar.png      # kontur gambar PNG
+
+from fourier_epicycles import (fourier_series, chain_xy, pen_trajectory, trajectory_xy,
+                                 truncate, visible_count, Trail)
+from fourier_shapes import load_series
+
 # ── KONFIGURASI ─────────────────────────────────────────────────────────────
 WINDOW_WIDTH, WINDOW_HEIGHT = 600, 600
 FPS                        = 30
@@ -11,41 +19,59 @@ TIME_SCALE                 = 1     # multiplier kecepatan animasi
 SCALE_X                    = -1    # flip horizontal jika perlu
 SCALE_Y                    = -1    # flip vertikal untuk orientasi
 SCALE_FACTOR               = 15    # skala (zoom) epicycle
+SHOW_CIRCLES               = True  # tombol C: tampilkan/sembunyikan epicycle
+MIN_ENERGY                 = None  # mis. 0.9999: simpan koefisien secukupnya untuk fraksi energi ini
+MAX_PIXEL_ERROR            = 0.5   # galat pena maksimum (piksel); None = semua koefisien
+MIN_RADIUS                 = 1     # lingkaran di bawah ini (piksel) tidak digambar
+FADE_TRAIL                 = False # True: jejak memudar menurut umur
+SHAPE_FILE                 = sys.argv[1] if len(sys.argv) > 1 else None   # file .svg/.csv/.png
 
 # ── FUNGSI PARAMETRIK HATI ─────────────────────────────────────────────────
 def heart_parametric(t):
-    x = 16 * math.sin(t)**3
-    y = 13 * math.cos(t) - 5 * math.cos(2 * t) - 2 * math.cos(3 * t) - math.cos(4 * t)
-    return complex(x, y)
-
-# ── SAMPEL KURVA HATI ───────────────────────────────────────────────────────
-ts = np.linspace(0, 2 * math.pi, NUM_SAMPLES, endpoint=False)
-pts = np.array([heart_parametric(t) for t in ts])
+    x = 16 * np.sin(t)**3
+    y = 13 * np.cos(t) - 5 * np.cos(2 * t) - 2 * np.cos(3 * t) - np.cos(4 * t)
+    return x + 1j * y          # bekerja untuk array t sekaligus
 
 # ── HITUNG KOEFISIEN FOURIER ────────────────────────────────────────────────
-coeffs = np.fft.fft(pts) / NUM_SAMPLES
-freqs  = np.fft.fftfreq(NUM_SAMPLES, d=1/NUM_SAMPLES)
-fourier = sorted(
-    [(f, abs(c), np.angle(c)) for f, c in zip(freqs, coeffs)],
-    key=lambda x: x[1], reverse=True
-)
-NUM_CIRCLES = len(fourier)  # untuk ditampilkan di layar
+# amplitudo terbesar lebih dulu; bentuk dari file diresample per panjang
+# busur dan koefisiennya di-cache (.npz) untuk start berikutnya
+if SHAPE_FILE:
+    freqs, coeffs = load_series(SHAPE_FILE, NUM_SAMPLES)
+else:
+    ts = np.linspace(0, 2 * math.pi, NUM_SAMPLES, endpoint=False)
+    freqs, coeffs = fourier_series(heart_parametric(ts))
+
+# ── POTONG KOEFISIEN (ENERGI PARSEVAL / GALAT PIKSEL) DAN BUANG LINGKARAN SUB-PIKSEL
+PIXEL_SCALE = SCALE_FACTOR * max(abs(SCALE_X), abs(SCALE_Y))
+freqs, coeffs = truncate(freqs, coeffs, MIN_ENERGY,
+                         None if MAX_PIXEL_ERROR is None else MAX_PIXEL_ERROR / PIXEL_SCALE)
+NUM_VISIBLE = visible_count(coeffs, PIXEL_SCALE, MIN_RADIUS)
+visible_freqs, visible_coeffs = freqs[:NUM_VISIBLE], coeffs[:NUM_VISIBLE]
+radii = (np.abs(visible_coeffs) * SCALE_FACTOR).astype(int).tolist()
+NUM_CIRCLES = len(coeffs)  # untuk ditampilkan di layar
 
 # ── INISIALISASI PYGAME ─────────────────────────────────────────────────────
 pygame.init()
 pygame.font.init()
 font = pygame.font.SysFont(None, 24)
 screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
-pygame.display.set_caption("Fourier Pen: Draw Heart Shape – Enter Reset, Space Quit")
+pygame.display.set_caption("Fourier Pen: Draw Heart Shape – Enter Reset, Space Quit, C Circles")
 clock  = pygame.time.Clock()
 
 # ── STATE ANIMASI ──────────────────────────────────────────────────────────
-time_val = 0.0
-dt       = (2 * math.pi / NUM_SAMPLES) * TIME_SCALE
-path     = []
+step     = 0                        # indeks frame dalam satu periode
+path     = Trail(NUM_SAMPLES)       # ring buffer jejak pena
 running  = True
+show_circles = SHOW_CIRCLES
 CENTER   = (WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2)
 
+# ── LINTASAN PENA SATU PERIODE: SATU INVERSE FFT, DIAMBIL PER INDEKS
+STEPS_PER_PERIOD = max(1, round(NUM_SAMPLES / TIME_SCALE))
+dt       = 2 * math.pi / STEPS_PER_PERIOD
+pen_x, pen_y = trajectory_xy(pen_trajectory(freqs, coeffs, STEPS_PER_PERIOD), CENTER,
+                             SCALE_X * SCALE_FACTOR, SCALE_Y * SCALE_FACTOR)
+pen_x, pen_y = pen_x.tolist(), pen_y.tolist()
+
 # ── LOOP UTAMA ─────────────────────────────────────────────────────────────
 while running:
     for event in pygame.event.get():
@@ -55,8 +81,10 @@ while running:
             if event.key == pygame.K_SPACE:
                 running = False
             elif event.key in (pygame.K_RETURN, pygame.K_KP_ENTER):
-                time_val = 0.0
+                step = 0
                 path.clear()
+            elif event.key == pygame.K_c:
+                show_circles = not show_circles
 
     screen.fill((30, 30, 30))  # latar gelap
 
@@ -65,26 +93,26 @@ while running:
     screen.blit(info_text, (10, 10))
 
     # ── GAMBARKAN EPICYCLES (UNDERLAY), SEPERTI MEKANISME PEN
-    x0, y0 = CENTER
-    for freq, amp, phase in fourier:
-        x1 = x0 + SCALE_X * amp * math.cos(freq * time_val + phase) * SCALE_FACTOR
-        y1 = y0 + SCALE_Y * amp * math.sin(freq * time_val + phase) * SCALE_FACTOR
-        pygame.draw.circle(screen, (80, 80, 80), (int(x0), int(y0)), int(amp * SCALE_FACTOR), 1)
-        pygame.draw.line(screen, (150, 150, 150), (int(x0), int(y0)), (int(x1), int(y1)), 2)
-        x0, y0 = x1, y1
+    # ujung pena dari lintasan; sendi rantai hanya dihitung bila lingkaran terlihat
+    x0, y0 = pen_x[step], pen_y[step]
+    if show_circles:
+        xs, ys = chain_xy(visible_freqs, visible_coeffs, step * dt, CENTER,
+                          SCALE_X * SCALE_FACTOR, SCALE_Y * SCALE_FACTOR)
+        joints = list(zip(xs.astype(int).tolist(), ys.astype(int).tolist()))
+        for center, r in zip(joints, radii):
+            pygame.draw.circle(screen, (80, 80, 80), center, r, 1)
+        # segmen terakhir ke pena membawa gabungan lingkaran sub-piksel
+        joints.append((int(x0), int(y0)))
+        pygame.draw.lines(screen, (150, 150, 150), False, joints, 2)
 
     # ── GAMBARKAN JALUR HATI (OVERLAY) DI TITIK EPICYCLES
-    tip = (int(x0), int(y0))
-    path.insert(0, tip)
-    if len(path) > NUM_SAMPLES:
-        path.pop()
-    if len(path) > 1:
-        pygame.draw.lines(screen, (220, 20, 60), False, path, 2)
+    path.append(int(x0), int(y0))
+    path.draw(screen, (220, 20, 60), 2, (30, 30, 30) if FADE_TRAIL else None)
 
     # ── UPDATE WAKTU DAN ULANGI
-    time_val += dt
-    if time_val > 2 * math.pi:
-        time_val = 0.0
+    step += 1
+    if step >= STEPS_PER_PERIOD:
+        step = 0
         path.clear()
 
     pygame.display.flip()
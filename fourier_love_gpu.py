@@ -4,6 +4,8 @@ import numpy as np
 import math
 import sys
 
+from fourier_epicycles import Trail
+
 # ── KONFIGURASI ─────────────────────────────────────────────────────────────
 WINDOW_WIDTH, WINDOW_HEIGHT = 800, 600
 FPS                        = 60
@@ -12,6 +14,7 @@ time_scale                 = 1.0     # pengali kecepatan animasi
 SCALE_X                    = -1      # flip horizontal jika perlu
 SCALE_Y                    = -1      # flip vertikal untuk orientasi
 SCALE_FACTOR               = 0.05    # skala (zoom) epicycle
+FADE_TRAIL                 = False   # True: jejak memudar menurut umur
 
 # ── PARAMETRIK HATI ─────────────────────────────────────────────────────────
 # Sample dasar untuk DFT
@@ -40,7 +43,7 @@ phases_dev = cp.array(phases, dtype=cp.float64)
 
 time_val = 0.0
 dt = (2 * math.pi / NUM_CIRCLES) * time_scale
-path = []
+path = Trail(NUM_CIRCLES)   # ring buffer jejak pena (10000 titik)
 running = True
 CENTER = (WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2)
 
@@ -83,12 +86,9 @@ while running:
         x0, y0 = x1, y1
 
     # Gambar path
-    tip = (int(x0), int(y0))
-    path.insert(0, tip)
-    if len(path) > NUM_CIRCLES:
-        path.pop()
-    if len(path) > 1:
-        game.draw.lines(screen, (220,20,60), False, path, 2)
+    # tanpa insert(0)/pop: titik terlama tertimpa, digambar dari view NumPy
+    path.append(int(x0), int(y0))
+    path.draw(screen, (220,20,60), 2, (30,30,30) if FADE_TRAIL else None)
 
     # Update waktu dan looping
     time_val += dt
@@ -0,0 +1,165 @@
+import numpy as np
+
+# ── Bitmap contours for fourier_love*.py ────────────────────────────────────
+# A PNG becomes one closed path in four steps:
+#   1. ink mask: alpha if the image is transparent, else dark pixels; inverted
+#      when "ink" covers most of the image (light drawing on dark background)
+#   2. edge pixels: ink with at least one non-ink 4-neighbour
+#   3. chains: edge pixels walked through their 8-neighbourhood (4-neighbours
+#      first) into polylines, from a neighbour table built with numpy
+#   4. chain order: nearest-neighbour tour over chain ends, improved by 2-opt
+#      moves that reverse whole runs of chains; each candidate move for a
+#      given start is scored for all ends at once
+# fourier_shapes.load_points() then resamples it by arc length for the FFT.
+
+INK_THRESHOLD = 128          # grey level (0-255) below which a pixel is ink
+TWO_OPT_PASSES = 10
+TWO_OPT_MIN_GAIN = 0.01       # stop once a pass shortens the gaps by less than 1%
+
+# 4-neighbours first, so chains follow the outline rather than cut corners
+_OFFSETS = [(0, 1), (1, 0), (0, -1), (-1, 0), (1, 1), (1, -1), (-1, 1), (-1, -1)]
+
+
+def load_image(path):
+    """(height, width, 4) uint8 RGBA array of an image file."""
+    import pygame            # the fourier scripts need it anyway; no display needed
+    surface = pygame.image.load(path)
+    rgb = pygame.surfarray.pixels3d(surface).swapaxes(0, 1)
+    if surface.get_flags() & pygame.SRCALPHA:
+        alpha = pygame.surfarray.pixels_alpha(surface).T
+    else:
+        alpha = np.full(rgb.shape[:2], 255, dtype=np.uint8)
+    return np.dstack([rgb, alpha])
+
+
+def ink_mask(rgba, threshold=INK_THRESHOLD):
+    """Boolean mask of the drawn pixels."""
+    alpha = rgba[..., 3]
+    if alpha.min() < threshold:
+        ink = alpha >= threshold
+    else:
+        grey = rgba[..., :3].astype(np.float32) @ np.array([0.299, 0.587, 0.114], np.float32)
+        ink = grey < threshold
+    # The drawing is the minority; otherwise this is light on dark
+    return ~ink if ink.mean() > 0.5 else ink
+
+
+def edge_mask(ink):
+    """Ink pixels with at least one non-ink 4-neighbour (image border counts)."""
+    p = np.pad(ink, 1)
+    interior = p[:-2, 1:-1] & p[2:, 1:-1] & p[1:-1, :-2] & p[1:-1, 2:]
+    return ink & ~interior
+
+
+def trace_chains(edge):
+    """Edge pixels grouped into polylines (lists of (row, col) arrays).
+
+    Each chain grows from a seed in both directions, always stepping to an
+    unvisited 8-neighbour, so a closed outline usually comes out as one chain.
+    """
+    rows, cols = np.nonzero(edge)
+    index = np.full((edge.shape[0] + 2, edge.shape[1] + 2), -1)
+    index[rows + 1, cols + 1] = np.arange(len(rows))
+    neighbours = np.stack([index[rows + 1 + dr, cols + 1 + dc] for dr, dc in _OFFSETS], axis=1)
+    neighbours = neighbours.tolist()
+    visited = bytearray(len(rows))
+
+    def walk(start):
+        out = []
+        cur = start
+        while True:
+            for nxt in neighbours[cur]:
+                if nxt >= 0 and not visited[nxt]:
+                    break
+            else:
+                return out
+            visited[nxt] = 1
+            out.append(nxt)
+            cur = nxt
+
+    chains = []
+    for seed in range(len(rows)):
+        if visited[seed]:
+            continue
+        visited[seed] = 1
+        forward = walk(seed)
+        backward = walk(seed)
+        chain = np.array(backward[::-1] + [seed] + forward)
+        chains.append(np.stack([rows[chain], cols[chain]], axis=1))
+    return chains
+
+
+def nearest_neighbour_tour(starts, ends):
+    """Greedy order and orientation of chains by the nearest free chain end.
+
+    Returns (order, flipped); flipped chains are walked from end to start.
+    """
+    m = len(starts)
+    free = np.ones(m, bool)
+    order, flipped = [0], [False]
+    free[0] = False
+    pos = ends[0]
+    for _ in range(m - 1):
+        d_start = np.abs(starts - pos)
+        d_end = np.abs(ends - pos)
+        d = np.where(free, np.minimum(d_start, d_end), np.inf)
+        k = int(np.argmin(d))
+        flip = bool(d_end[k] < d_start[k])
+        order.append(k)
+        flipped.append(flip)
+        free[k] = False
+        pos = starts[k] if flip else ends[k]
+    return np.array(order), np.array(flipped)
+
+
+def two_opt(heads, tails, passes=TWO_OPT_PASSES, min_gain=TWO_OPT_MIN_GAIN):
+    """Improve a closed tour of oriented chains with 2-opt moves.
+
+    heads[p]/tails[p] are where the pen enters/leaves the chain at position
+    p (complex).  Reversing positions i..j reverses each chain in it too, so
+    the gap edges become tails[i-1] -> tails[j] and heads[i] -> heads[j+1].
+    Stops after `passes` passes or once a pass saves less than `min_gain`
+    of the total gap length.  Returns the permutation of positions and a
+    per-position "reversed" flag.
+    """
+    m = len(heads)
+    heads, tails = heads.copy(), tails.copy()
+    perm = np.arange(m)
+    rev = np.zeros(m, bool)
+    for _ in range(passes):
+        length = np.abs(np.roll(heads, -1) - tails).sum()
+        saved = 0.0
+        for i in range(1, m):
+            j = np.arange(i, m)
+            nxt = (j + 1) % m
+            delta = (np.abs(tails[i - 1] - tails[j]) + np.abs(heads[i] - heads[nxt])
+                     - np.abs(tails[i - 1] - heads[i]) - np.abs(tails[j] - heads[nxt]))
+            k = int(np.argmin(delta))
+            if delta[k] < -1e-9:
+                s = slice(i, j[k] + 1)
+                heads[s], tails[s] = tails[s][::-1].copy(), heads[s][::-1].copy()
+                perm[s] = perm[s][::-1].copy()
+                rev[s] = ~rev[s][::-1]
+                saved -= delta[k]
+        if saved <= min_gain * length:
+            break
+    return perm, rev
+
+
+def contour_path(path, threshold=INK_THRESHOLD):
+    """One closed polyline (complex, y up) through every contour of a bitmap."""
+    chains = trace_chains(edge_mask(ink_mask(load_image(path), threshold)))
+    if not chains:
+        raise ValueError(f"no ink found in {path!r}")
+    # Longest chain first, so the tour starts on the main outline
+    chains.sort(key=len, reverse=True)
+    pts = [c[:, 1] - 1j * c[:, 0] for c in chains]         # (col, -row): y up
+    starts = np.array([p[0] for p in pts])
+    ends = np.array([p[-1] for p in pts])
+
+    order, flipped = nearest_neighbour_tour(starts, ends)
+    heads = np.where(flipped, ends[order], starts[order])
+    tails = np.where(flipped, starts[order], ends[order])
+    perm, rev = two_opt(heads, tails)
+    order, flipped = order[perm], flipped[perm] ^ rev
+    return np.concatenate([pts[k][::-1] if f else pts[k] for k, f in zip(order, flipped)])
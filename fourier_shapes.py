@@ -0,0 +1,202 @@
+import hashlib
+import io
+import math
+import os
+import re
+
+import numpy as np
+
+from fourier_epicycles import fourier_series
+from fourier_raster import contour_path
+
+# ── Shape input for fourier_love*.py ────────────────────────────────────────
+# A shape is an SVG file (the `d` of every <path>), a CSV of x,y points or
+# a PNG bitmap (contours joined into one path, see fourier_raster).  It is
+# flattened to a polyline, centred, scaled to the size of the built-in
+# heart, resampled to N points evenly spaced by arc length and turned into
+# amplitude-sorted Fourier coefficients.  The (freq, amp, phase) arrays are
+# cached as .npz, keyed by a hash of the file contents and N, so the second
+# start on the same shape skips all of it.
+#
+# python fourier_love.py shape.svg
+# python fourier_love3.py points.csv
+# python fourier_love3.py drawing.png
+
+CACHE_DIR = ".fourier_cache"
+CACHE_VERSION = b"2"      # bump when the points for a given file change
+SHAPE_SIZE = 17          # largest |z| after normalising; the heart spans ~±17
+CURVE_STEPS = 16         # points per Bezier / arc segment before resampling
+
+_TOKEN = re.compile(r"[MmLlHhVvCcSsQqTtAaZz]|[-+]?(?:\d*\.\d+|\d+\.?)(?:[eE][-+]?\d+)?")
+_ARGS = {"M": 2, "L": 2, "H": 1, "V": 1, "C": 6, "S": 4, "Q": 4, "T": 2, "A": 7, "Z": 0}
+
+
+def _bezier(controls, steps=CURVE_STEPS):
+    """Points of a Bezier curve (complex control points), start excluded."""
+    s = np.linspace(0, 1, steps + 1)[1:, None]
+    n = len(controls) - 1
+    k = np.arange(n + 1)
+    binom = np.array([math.comb(n, j) for j in k])
+    weights = binom * s ** k * (1 - s) ** (n - k)
+    return weights @ np.asarray(controls)
+
+
+def _arc(start, rx, ry, angle, large, sweep, end, steps=CURVE_STEPS):
+    """Points of an SVG elliptical arc, start excluded (SVG 1.1 F.6.5)."""
+    if rx == 0 or ry == 0 or start == end:
+        return np.array([end])
+    rx, ry = abs(rx), abs(ry)
+    rot = np.exp(1j * np.radians(angle))
+    p = (start - end) / 2 / rot
+    # Scale the radii up if the end point is out of reach
+    lam = (p.real / rx) ** 2 + (p.imag / ry) ** 2
+    if lam > 1:
+        rx, ry = rx * np.sqrt(lam), ry * np.sqrt(lam)
+    num = rx * rx * ry * ry - rx * rx * p.imag ** 2 - ry * ry * p.real ** 2
+    den = rx * rx * p.imag ** 2 + ry * ry * p.real ** 2
+    root = np.sqrt(max(num, 0) / den) * (-1 if large == sweep else 1)
+    c = complex(root * rx * p.imag / ry, -root * ry * p.real / rx)
+    theta0 = np.angle(complex((p.real - c.real) / rx, (p.imag - c.imag) / ry))
+    theta1 = np.angle(complex((-p.real - c.real) / rx, (-p.imag - c.imag) / ry))
+    delta = (theta1 - theta0) % (2 * np.pi)
+    if not sweep:
+        delta -= 2 * np.pi
+    theta = theta0 + delta * np.linspace(0, 1, steps + 1)[1:]
+    centre = c * rot + (start + end) / 2
+    return centre + rot * (rx * np.cos(theta) + 1j * ry * np.sin(theta))
+
+
+def parse_svg_path(d):
+    """Polyline (complex array) of SVG path data, curves flattened.
+
+    Supports every path command, absolute and relative.  Subpaths are joined
+    in order, so the pen jumps straight from the end of one to the next.
+    """
+    tokens = _TOKEN.findall(d)
+    pieces = []
+    pos = start = 0j
+    last_ctrl, last_cmd = None, ""
+    i, cmd = 0, ""
+    while i < len(tokens):
+        if tokens[i].isalpha():
+            cmd = tokens[i]
+            i += 1
+        elif not cmd:
+            raise ValueError("SVG path data must start with a command")
+        upper = cmd.upper()
+        args = [float(t) for t in tokens[i:i + _ARGS[upper]]]
+        if len(args) < _ARGS[upper]:
+            raise ValueError(f"SVG path command {cmd!r} is missing arguments")
+        i += _ARGS[upper]
+        base = pos if cmd.islower() else 0j
+        pts = [complex(args[j], args[j + 1]) + base for j in range(0, len(args) - 1, 2)]
+        ctrl = None
+
+        if upper == "M":
+            pos = start = pts[0]
+            pieces.append(np.array([pos]))
+            cmd = "l" if cmd == "m" else "L"        # extra pairs are line-tos
+        elif upper == "L":
+            pos = pts[-1]
+            pieces.append(np.array([pos]))
+        elif upper == "H":
+            pos = complex(args[0] + (pos.real if cmd == "h" else 0), pos.imag)
+            pieces.append(np.array([pos]))
+        elif upper == "V":
+            pos = complex(pos.real, args[0] + (pos.imag if cmd == "v" else 0))
+            pieces.append(np.array([pos]))
+        elif upper == "C":
+            pieces.append(_bezier([pos] + pts))
+            ctrl, pos = pts[1], pts[2]
+        elif upper == "S":
+            first = 2 * pos - last_ctrl if last_cmd in ("C", "S") else pos
+            pieces.append(_bezier([pos, first] + pts))
+            ctrl, pos = pts[0], pts[1]
+        elif upper == "Q":
+            pieces.append(_bezier([pos] + pts))
+            ctrl, pos = pts[0], pts[1]
+        elif upper == "T":
+            ctrl = 2 * pos - last_ctrl if last_cmd in ("Q", "T") else pos
+            pieces.append(_bezier([pos, ctrl, pts[0]]))
+            pos = pts[0]
+        elif upper == "A":
+            end = complex(args[5], args[6]) + base
+            pieces.append(_arc(pos, args[0], args[1], args[2], bool(args[3]), bool(args[4]), end))
+            pos = end
+        elif upper == "Z":
+            pos = start
+            pieces.append(np.array([pos]))
+        last_ctrl, last_cmd = ctrl, upper if upper != "M" else "L"
+    if not pieces:
+        raise ValueError("SVG path data has no points")
+    return np.concatenate(pieces)
+
+
+def load_svg(text):
+    """Polyline of all <path d="..."> elements in an SVG document, y up."""
+    paths = re.findall(r"<path\b[^>]*?\sd\s*=\s*([\"'])(.*?)\1", text, re.S)
+    if not paths:
+        raise ValueError("no <path d=...> found in the SVG")
+    pts = np.concatenate([parse_svg_path(d) for _, d in paths])
+    return pts.conjugate()              # SVG y points down
+
+
+def load_csv(text):
+    """Polyline of an x,y CSV (an optional header line is skipped)."""
+    first = text.lstrip().split("\n", 1)[0]
+    header = 1 if re.search(r"[A-DF-Za-df-z]", first) else 0
+    xy = np.loadtxt(io.StringIO(text), delimiter=",", skiprows=header, ndmin=2)
+    return xy[:, 0] + 1j * xy[:, 1]
+
+
+def normalize(points, size=SHAPE_SIZE):
+    """Centre on the bounding box and scale so the largest |z| is `size`."""
+    centre = complex((points.real.max() + points.real.min()) / 2,
+                     (points.imag.max() + points.imag.min()) / 2)
+    points = points - centre
+    return points * (size / np.abs(points).max())
+
+
+def resample(points, n):
+    """n points evenly spaced by arc length along the closed polyline."""
+    closed = np.append(points, points[0])
+    seg = np.abs(np.diff(closed))
+    keep = np.concatenate([[True], seg > 0])    # np.interp needs increasing xp
+    s = np.concatenate([[0], np.cumsum(seg)])[keep]
+    closed = closed[keep]
+    target = np.linspace(0, s[-1], n, endpoint=False)
+    return np.interp(target, s, closed.real) + 1j * np.interp(target, s, closed.imag)
+
+
+def load_points(path, n):
+    """N arc-length samples of the shape in an .svg, .csv or .png file."""
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".png":
+        raw = contour_path(path)
+    elif ext in (".svg", ".csv"):
+        with open(path, encoding="utf-8") as fh:
+            text = fh.read()
+        raw = load_svg(text) if ext == ".svg" else load_csv(text)
+    else:
+        raise ValueError(f"unsupported shape file {path!r} (use .svg, .csv or .png)")
+    # The scripts draw with SCALE_X = -1 (harmless for the symmetric heart),
+    # so mirror x here to show shapes the right way round
+    return -resample(normalize(raw), n).conjugate()
+
+
+def cache_path(path, n, cache_dir=CACHE_DIR):
+    with open(path, "rb") as fh:
+        digest = hashlib.sha256(CACHE_VERSION + fh.read()).hexdigest()[:20]
+    return os.path.join(cache_dir, f"{digest}_{n}.npz")
+
+
+def load_series(path, n, cache_dir=CACHE_DIR):
+    """(freqs, coeffs) of a shape file as fourier_series() returns them, cached."""
+    cached = cache_path(path, n, cache_dir)
+    if os.path.exists(cached):
+        with np.load(cached) as data:
+            return data["freq"], data["amp"] * np.exp(1j * data["phase"])
+    freqs, coeffs = fourier_series(load_points(path, n))
+    os.makedirs(cache_dir, exist_ok=True)
+    np.savez(cached, freq=freqs, amp=np.abs(coeffs), phase=np.angle(coeffs))
+    return freqs, coeffs
@@ -0,0 +1,170 @@
+import argparse
+import math
+import time
+from collections import namedtuple
+
+import numpy as np
+
+# Batched N-dimensional Monte Carlo integration
+# ---------------------------------------------
+# integrate(f, lower, upper, n) estimates the integral of a vectorized
+# integrand (or indicator) over the box [lower, upper].  Samples are streamed
+# in fixed-size blocks, so memory depends on the block size only; running
+# sums are merged per block (Chan et al.) and can be merged across workers.
+
+# python mcintegrate.py --samples 1e7 --dims 2 3 4 5 6 8 10
+
+DEFAULT_BLOCK = 1 << 18
+
+Result = namedtuple("Result", "estimate stderr samples seconds rate")
+
+
+class Accumulator:
+    """Running count, mean and sum of squared deviations of f-values.
+
+    While only indicator (bool) values are added, `hits` also keeps their
+    exact integer sum; it becomes None once any other values are mixed in.
+    """
+
+    def __init__(self, n=0, mean=0.0, m2=0.0, hits=None):
+        self.n = n
+        self.mean = mean
+        self.m2 = m2
+        self.hits = 0 if n == 0 and hits is None else hits
+
+    def add(self, values):
+        m = len(values)
+        if m == 0:
+            return
+        values = np.asarray(values)
+        if values.dtype == bool:
+            # Indicator: k hits give mean k/m and m2 = k * (1 - k/m) exactly
+            k = int(np.count_nonzero(values))
+            block_mean = k / m
+            block_m2 = k * (1 - block_mean)
+            self.merge(Accumulator(m, block_mean, block_m2, k))
+        else:
+            values = values.astype(np.float64, copy=False)
+            block_mean = float(values.mean())
+            block_m2 = float(((values - block_mean) ** 2).sum())
+            self.merge(Accumulator(m, block_mean, block_m2))
+
+    def merge(self, other):
+        n = self.n + other.n
+        if n == 0:
+            return self
+        if self.hits is not None and other.hits is not None:
+            self.hits += other.hits
+        else:
+            self.hits = None
+        delta = other.mean - self.mean
+        self.mean += delta * other.n / n
+        self.m2 += other.m2 + delta * delta * self.n * other.n / n
+        self.n = n
+        return self
+
+    @property
+    def total(self):
+        """Sum of all values (the hit count for an indicator)."""
+        return self.mean * self.n
+
+    @property
+    def variance(self):
+        return self.m2 / (self.n - 1) if self.n > 1 else float("nan")
+
+    def stderr(self):
+        return math.sqrt(self.variance / self.n) if self.n > 1 else float("nan")
+
+
+def box(lower, upper):
+    """Validate box bounds; returns (lower, width, volume) arrays/floats."""
+    lower = np.atleast_1d(np.asarray(lower, dtype=np.float64))
+    upper = np.atleast_1d(np.asarray(upper, dtype=np.float64))
+    if lower.shape != upper.shape or np.any(upper <= lower):
+        raise ValueError("lower and upper must have the same shape with upper > lower")
+    width = upper - lower
+    return lower, width, float(np.prod(width))
+
+
+def accumulate(f, lower, upper, n, rng, block=DEFAULT_BLOCK, acc=None):
+    """Stream n uniform samples of the box through f into an Accumulator.
+
+    Points are drawn row-wise as rng.random((m, d)), so the sample sequence
+    does not depend on the block size.
+    """
+    lower, width, _ = box(lower, upper)
+    unit = not np.any(lower) and np.all(width == 1)
+    acc = acc or Accumulator()
+    left = n
+    while left > 0:
+        m = min(block, left)
+        pts = rng.random((m, len(lower)))
+        if not unit:
+            pts *= width
+            pts += lower
+        acc.add(f(pts))
+        left -= m
+    return acc
+
+
+def integrate(f, lower, upper, n, seed=None, block=DEFAULT_BLOCK, rng=None):
+    """Monte Carlo integral of f over [lower, upper].
+
+    `f` takes an (m, d) array of points and returns m values; booleans
+    work as indicators (the result is then a volume).  Returns a Result with
+    the estimate, its standard error, the sample count, the elapsed time and
+    the throughput in samples per second.
+    """
+    rng = rng or np.random.default_rng(seed)
+    _, _, volume = box(lower, upper)
+    start = time.perf_counter()
+    acc = accumulate(f, lower, upper, int(n), rng, block)
+    elapsed = time.perf_counter() - start
+    return Result(volume * acc.mean, volume * acc.stderr(), acc.n,
+                  elapsed, acc.n / elapsed if elapsed > 0 else float("inf"))
+
+
+def ball_indicator(center, radius=1.0):
+    """Vectorized indicator of the closed ball |x - center| <= radius."""
+    center = np.asarray(center, dtype=np.float64)
+    r2 = radius * radius
+
+    def inside(pts):
+        d = pts - center
+        return np.einsum("ij,ij->i", d, d) <= r2
+    return inside
+
+
+def ball_volume(dims, radius=1.0):
+    """Exact volume of a dims-dimensional ball."""
+    return math.pi ** (dims / 2) / math.gamma(dims / 2 + 1) * radius ** dims
+
+
+def hypersphere_volume(dims, n, radius=1.0, seed=None, block=DEFAULT_BLOCK):
+    """Monte Carlo volume of a ball in its bounding cube."""
+    center = np.zeros(dims)
+    return integrate(ball_indicator(center, radius), center - radius, center + radius,
+                     n, seed, block)
+
+
+def parse_args():
+    p = argparse.ArgumentParser(description="N-dimensional Monte Carlo integration demo (ball volumes)")
+    p.add_argument("--samples", type=float, default=1e7, help="Samples per estimate")
+    p.add_argument("--dims",    type=int,   nargs="+", default=[2, 3, 4, 5, 6, 8, 10], help="Dimensions")
+    p.add_argument("--block",   type=int,   default=DEFAULT_BLOCK, help="Samples per block")
+    p.add_argument("--seed",    type=int,   default=None, help="RNG seed")
+    return p.parse_args()
+
+
+def main():
+    args = parse_args()
+    print(f"{'dims':>4}{'estimate':>14}{'std err':>11}{'exact':>14}{'error':>11}{'samples/s':>14}")
+    for d in args.dims:
+        res = hypersphere_volume(d, int(args.samples), seed=args.seed, block=args.block)
+        exact = ball_volume(d)
+        print(f"{d:>4}{res.estimate:>14.8f}{res.stderr:>11.2e}{exact:>14.8f}"
+              f"{res.estimate - exact:>+11.2e}{res.rate:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,209 @@
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+import pinewton
+
+# Newton basins of attraction (Newton fractal)
+# --------------------------------------------
+# pinewton.py follows one Newton iteration from x0 = 3.  Here the same
+# iteration runs on a whole complex grid of starting points at once: every
+# pixel is a starting point, and only the still-active pixels are kept
+# (compressed index array) so converged ones drop out early.  Each pixel is
+# coloured by the root it converges to (its basin), shaded by its iteration
+# count.  Rows are split into tiles over a process pool.
+
+# python newton_fractal.py --function tan --width 1600 --height 1200 --out basins.png
+# python newton_fractal.py --function cubic --iterations-out iters.png --show
+
+
+def poly(coeffs):
+    """(f, df) for the polynomial with the given coefficients (highest first)."""
+    p = np.poly1d(coeffs)
+    return p, p.deriv()
+
+
+# Name -> (f, df, default view: center, span).  Functions are looked up by
+# name in the workers, so they only need to be importable.
+FUNCTIONS = {
+    "tan":     (pinewton.f, pinewton.df, (np.pi, 16.0)),     # roots PI + 4*PI*k
+    "sin":     (np.sin, np.cos, (np.pi, 8.0)),               # roots k*PI
+    "cubic":   (*poly([1, 0, 0, -1]), (0.0, 3.0)),           # z^3 - 1
+    "quartic": (*poly([1, 0, 0, 0, -1]), (0.0, 3.0)),        # z^4 - 1
+    "quintic": (*poly([1, 0, 0, 0, -1, 0]), (0.0, 3.0)),     # z^5 - z
+}
+
+TOLERANCE = 1e-10    # |step| below which a pixel counts as converged
+RESIDUAL = 1e-6      # ... provided |f(z)| is this small (rejects df -> inf)
+MAX_ITER = 64
+TILE_ROWS = 64       # rows per pool task
+ROOT_DECIMALS = 5    # roots closer than this are treated as the same basin
+
+
+def newton_grid(z, f, df, tol=TOLERANCE, max_iter=MAX_ITER):
+    """Run Newton's method from every element of z simultaneously.
+
+    Returns (final z, iteration counts, converged mask), all shaped like z.
+    Pixels that have not converged after max_iter keep iters == max_iter.
+    """
+    z = np.array(z, dtype=np.complex128).ravel()
+    iters = np.full(z.shape, max_iter, dtype=np.int32)
+    converged = np.zeros(z.shape, dtype=bool)
+    active = np.arange(z.size)
+    with np.errstate(all="ignore"):
+        for k in range(1, max_iter + 1):
+            if active.size == 0:
+                break
+            za = z[active]
+            step = f(za) / df(za)
+            za -= step
+            z[active] = za
+            small = np.abs(step) < tol
+            if np.any(small):
+                hit = active[small]
+                ok = np.abs(f(za[small])) < RESIDUAL
+                iters[hit[ok]] = k
+                converged[hit[ok]] = True
+                small[small] = ok
+            # Drop converged pixels and ones that have blown up
+            active = active[~small & np.isfinite(za)]
+    return z, iters, converged
+
+
+def grid(center, span, width, height, row0=0, row1=None):
+    """Complex starting points for rows [row0, row1) of the view."""
+    row1 = height if row1 is None else row1
+    x_span = span
+    y_span = span * height / width
+    xs = center.real - x_span / 2 + (np.arange(width) + 0.5) * x_span / width
+    ys = center.imag + y_span / 2 - (np.arange(row0, row1) + 0.5) * y_span / height
+    return xs[None, :] + 1j * ys[:, None]
+
+
+def render_tile(name, center, span, width, height, row0, row1, tol, max_iter):
+    """Worker entry point: Newton over one band of rows."""
+    f, df, _ = FUNCTIONS[name]
+    z0 = grid(center, span, width, height, row0, row1)
+    z, iters, conv = newton_grid(z0, f, df, tol, max_iter)
+    shape = z0.shape
+    return row0, z.reshape(shape), iters.reshape(shape), conv.reshape(shape)
+
+
+def label_roots(z, converged, decimals=ROOT_DECIMALS):
+    """Basin index per pixel (-1 where not converged) and the root list."""
+    labels = np.full(z.shape, -1, dtype=np.int32)
+    found = np.round(z[converged], decimals)
+    # +0.0 folds -0.0 into 0.0 so mirrored roots compare equal
+    roots, inverse = np.unique(found + 0.0, return_inverse=True)
+    labels[converged] = inverse.ravel()
+    return labels, roots
+
+
+def render(name, width, height, center=None, span=None, tol=TOLERANCE,
+           max_iter=MAX_ITER, workers=None, tile_rows=TILE_ROWS):
+    """Render the full view across a process pool.
+
+    Returns (z, iters, converged, seconds).
+    """
+    _, _, (default_center, default_span) = FUNCTIONS[name]
+    center = complex(default_center if center is None else center)
+    span = default_span if span is None else span
+    workers = workers or os.cpu_count() or 1
+    bands = [(r, min(r + tile_rows, height)) for r in range(0, height, tile_rows)]
+
+    z = np.empty((height, width), dtype=np.complex128)
+    iters = np.empty((height, width), dtype=np.int32)
+    conv = np.empty((height, width), dtype=bool)
+    start = time.perf_counter()
+    args = (name, center, span, width, height)
+    if workers == 1 or len(bands) == 1:
+        tiles = (render_tile(*args, r0, r1, tol, max_iter) for r0, r1 in bands)
+        pool = None
+    else:
+        pool = ProcessPoolExecutor(max_workers=workers)
+        tiles = (fut.result() for fut in
+                 [pool.submit(render_tile, *args, r0, r1, tol, max_iter) for r0, r1 in bands])
+    try:
+        for row0, tz, ti, tc in tiles:
+            rows = slice(row0, row0 + len(tz))
+            z[rows], iters[rows], conv[rows] = tz, ti, tc
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    return z, iters, conv, time.perf_counter() - start
+
+
+def basin_image(labels, iters, max_iter):
+    """RGB float image: hue by basin, darker the more iterations it took."""
+    import matplotlib
+    palette = np.asarray(matplotlib.colormaps["tab10"].colors)
+    rgb = palette[labels % len(palette)]
+    shade = 1.0 - 0.75 * np.sqrt(iters / max_iter)
+    rgb *= shade[..., None]
+    rgb[labels < 0] = 0.0
+    return rgb
+
+
+def parse_args():
+    p = argparse.ArgumentParser(description="Newton basins of attraction over a complex grid")
+    p.add_argument("--function",  default="tan", choices=list(FUNCTIONS), help="Function to solve f(z) = 0")
+    p.add_argument("--width",     type=int,   default=1000, help="Image width in pixels")
+    p.add_argument("--height",    type=int,   default=750,  help="Image height in pixels")
+    p.add_argument("--center",    type=float, nargs=2, default=None, metavar=("RE", "IM"),
+                   help="View center (default depends on the function)")
+    p.add_argument("--span",      type=float, default=None, help="Width of the view in the complex plane")
+    p.add_argument("--max-iter",  type=int,   default=MAX_ITER, help="Newton iterations per pixel")
+    p.add_argument("--tol",       type=float, default=TOLERANCE, help="Step size that counts as converged")
+    p.add_argument("--workers",   type=int,   default=None, help="Worker processes (default: all cores)")
+    p.add_argument("--tile-rows", type=int,   default=TILE_ROWS, help="Image rows per task")
+    p.add_argument("--out",       default="newton_basins.png", help="Basin image file")
+    p.add_argument("--iterations-out", default=None, help="Also save the iteration-count map here")
+    p.add_argument("--show",      action="store_true", help="Show the images in a window")
+    return p.parse_args()
+
+
+def main():
+    args = parse_args()
+    center = complex(*args.center) if args.center else None
+    z, iters, conv, elapsed = render(args.function, args.width, args.height, center, args.span,
+                                     args.tol, args.max_iter, args.workers, args.tile_rows)
+    labels, roots = label_roots(z, conv)
+
+    pixels = args.width * args.height
+    mean_iters = f"{iters[conv].mean():.1f}" if conv.any() else "none converged"
+    print(f"{args.width}x{args.height} in {elapsed:.2f} s ({pixels / elapsed / 1e6:.2f} Mpx/s) | "
+          f"converged: {conv.mean():.1%} | mean iterations: {mean_iters}")
+    if len(roots):
+        print(f"{len(roots)} roots found, e.g. {', '.join(f'{r:.6f}' for r in roots[:6])}")
+    else:
+        print("No roots found")
+
+    import matplotlib
+    if not args.show:
+        matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    plt.imsave(args.out, basin_image(labels, iters, args.max_iter))
+    print(f"Wrote {args.out}")
+    if args.iterations_out:
+        plt.imsave(args.iterations_out, iters, cmap="magma", vmin=0, vmax=args.max_iter)
+        print(f"Wrote {args.iterations_out}")
+    if args.show:
+        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 5))
+        view_center = center if center is not None else complex(FUNCTIONS[args.function][2][0])
+        span = args.span or FUNCTIONS[args.function][2][1]
+        extent = [view_center.real - span / 2, view_center.real + span / 2,
+                  view_center.imag - span * args.height / args.width / 2,
+                  view_center.imag + span * args.height / args.width / 2]
+        ax1.imshow(basin_image(labels, iters, args.max_iter), extent=extent)
+        ax1.set_title(f"Basins of attraction ({args.function})")
+        ax2.imshow(iters, cmap="magma", extent=extent)
+        ax2.set_title("Iterations to converge")
+        plt.tight_layout()
+        plt.show()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+import argparse
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from decimal import Context, Decimal, localcontext, MAX_EMAX, MIN_EMIN
+
+import numpy as np
+
+# BBP hexadecimal digit extraction
+# --------------------------------
+#     PI = sum_k 16^-k (4/(8k+1) - 2/(8k+4) - 1/(8k+5) - 1/(8k+6))
+#
+# The hex digits of PI after position n are the leading hex digits of
+# frac(16^n PI), and frac(16^n S_j) = frac(sum_{k<=n} (16^(n-k) mod (8k+j)) / (8k+j))
+# + a fast-vanishing tail, so no earlier digits are needed.  The modular
+# powers for a whole block of k are done at once with a vectorized
+# windowed square-and-shift over int64 arrays, and the fractions are summed in
+# 64-bit fixed point (uint64 wrap-around is the "mod 1").  Positions in a
+# batch are spread over a process pool.
+#
+# The error is below 8 (n + 1) 2^-64, so 8 hex digits are safe up to
+# n ~ 10^8 and 10 up to ~10^6.  Positions count
+# from 0 = the first hex digit after the point (PI = 3.243F6A88...).
+
+# python pibbp.py --positions 0 1000 1000000
+# python pibbp.py --check pi.txt --positions 1000 50000    # spot-check a pichudnovsky run
+
+BLOCK = 1 << 20                 # k values per vectorized block
+HEX_DIGITS = 8
+FRAC_BITS = 64                  # fractions are summed as 64-bit fixed point
+MASK = (1 << FRAC_BITS) - 1
+# Vectorized path needs r << 32 and r * r to fit in int64 (r < m = 8k + j)
+MAX_VECTOR_MODULUS = 1 << 31
+
+
+def pow16_mod(exponents, moduli, window=3):
+    """16^e mod m, element-wise, for int64 arrays with m < 2^31.
+
+    Left-to-right over `window`-bit chunks of e: square `window` times, then
+    multiply by 16^chunk, which is a left shift by 4 * chunk bits (at most
+    28, so r << shift stays below 2^63).  All in-place on one array.
+    """
+    result = np.ones_like(moduli)
+    bits = int(exponents.max()).bit_length()
+    mask = (1 << window) - 1
+    for b in range(-(-bits // window) * window - window, -1, -window):
+        for _ in range(window):
+            np.multiply(result, result, out=result)
+            np.remainder(result, moduli, out=result)
+        shift = ((exponents >> b) & mask) << 2
+        np.left_shift(result, shift, out=result)
+        np.remainder(result, moduli, out=result)
+    return result
+
+
+def fixed_fractions(r, m):
+    """floor(r / m * 2^64) as uint64 for int64 arrays with 0 <= r < m < 2^31."""
+    # Two 32-bit long-division steps keep every intermediate below 2^63
+    hi, rem = np.divmod(r << 32, m)
+    lo = (rem << 32) // m
+    return (hi.astype(np.uint64) << np.uint64(32)) | lo.astype(np.uint64)
+
+
+def series_frac(n, j, block=BLOCK):
+    """frac(sum_k 16^(n-k) / (8k+j)) as a 64-bit fixed-point integer.
+
+    Every term is truncated to 64 bits and the sum is taken mod 2^64, so
+    the error is below (n + 1) * 2^-64 -- no float rounding involved.
+    """
+    total = 0
+    for lo in range(0, n + 1, block):
+        k = np.arange(lo, min(lo + block, n + 1), dtype=np.int64)
+        m = 8 * k + j
+        if m[-1] < MAX_VECTOR_MODULUS:
+            # uint64 sums wrap around, which is exactly "mod 1"
+            total += int(fixed_fractions(pow16_mod(n - k, m), m).sum(dtype=np.uint64))
+        else:
+            total += sum((pow(16, int(e), int(mm)) << FRAC_BITS) // int(mm)
+                         for e, mm in zip(n - k, m))
+        total &= MASK
+    # Tail k > n: 16^(n-k) / (8k+j) shrinks by 16 per term
+    k = n + 1
+    while True:
+        term = (1 << FRAC_BITS) >> (4 * (k - n))
+        if term == 0:
+            break
+        total += term // (8 * k + j)
+        k += 1
+    return total & MASK
+
+
+def hex_digits(n, count=HEX_DIGITS):
+    """`count` hex digits of PI starting at fractional position n."""
+    x = (4 * series_frac(n, 1) - 2 * series_frac(n, 4)
+         - series_frac(n, 5) - series_frac(n, 6)) & MASK
+    return f"{x:0{FRAC_BITS // 4}X}"[:count]
+
+
+def extract(positions, count=HEX_DIGITS, workers=None):
+    """{position: hex digits} for a batch, computed across a process pool."""
+    positions = list(positions)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(positions) == 1:
+        return {n: hex_digits(n, count) for n in positions}
+    # Largest positions first so the long tasks do not start last
+    order = sorted(positions, reverse=True)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        digits = pool.map(hex_digits, order, [count] * len(order))
+        return dict(zip(order, digits))
+
+
+def hex_from_decimal(pi_digits, n, count=HEX_DIGITS):
+    """Hex digits at position n from a decimal digit string "3.1415..."."""
+    decimals = len(pi_digits) - 2
+    if (n + count) * math.log10(16) > decimals - 10:
+        raise ValueError(f"{decimals} decimals are not enough for hex position {n}")
+    with localcontext(Context(prec=decimals + 20, Emax=MAX_EMAX, Emin=MIN_EMIN)):
+        frac = Decimal(pi_digits) - 3
+        scaled = (frac * Decimal(16) ** (n + count)).to_integral_value(rounding="ROUND_FLOOR")
+        value = int(scaled % Decimal(16) ** count)
+    return f"{value:0{count}X}"
+
+
+def parse_args():
+    p = argparse.ArgumentParser(description="BBP hex digit extraction of PI at arbitrary positions")
+    p.add_argument("--positions", type=int, nargs="+", default=[0, 1000, 100000],
+                   help="Hex positions after the point (0 = first hex digit)")
+    p.add_argument("--count",   type=int, default=HEX_DIGITS, help="Hex digits per position (at most 16)")
+    p.add_argument("--workers", type=int, default=None, help="Worker processes (default: all cores)")
+    p.add_argument("--check",   default=None, metavar="FILE",
+                   help="Compare with a decimal digit file (e.g. pichudnovsky.py --out)")
+    return p.parse_args()
+
+
+def main():
+    args = parse_args()
+    start = time.perf_counter()
+    digits = extract(args.positions, args.count, args.workers)
+    elapsed = time.perf_counter() - start
+
+    reference = None
+    if args.check:
+        with open(args.check) as fh:
+            reference = fh.read().strip()
+    for n in args.positions:
+        line = f"{n:>12}  {digits[n]}"
+        if reference is not None:
+            try:
+                ref = hex_from_decimal(reference, n, args.count)
+                line += "  ok" if ref == digits[n] else f"  MISMATCH (file: {ref})"
+            except ValueError as e:
+                line += f"  ({e})"
+        print(line)
+    print(f"{len(args.positions)} positions in {elapsed:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,224 @@
+import argparse
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from decimal import Context, Decimal, Inexact, localcontext, MAX_EMAX, MAX_PREC, MIN_EMIN
+
+try:
+    import gmpy2
+except ImportError:          # optional; much faster big-integer arithmetic
+    gmpy2 = None
+
+# Chudnovsky PI by binary splitting
+# ---------------------------------
+#     1/PI = 12 sum_k (-1)^k (6k)! (13591409 + 545140134 k) / ((3k)! (k!)^3 640320^(3k + 3/2))
+#
+# Each term adds about 14.18 digits.  Binary splitting turns the sum over
+# [a, b) into three exact integers P, Q, T, built by recursive halving, and
+#     PI = 426880 sqrt(10005) Q / T.
+# The top-level split ranges are computed in a process pool and merged in
+# the parent, then one square root and one division finish the job.
+#
+# Backends for the exact integers:
+#   gmpy2    mpz (used if installed; fastest)
+#   decimal  integer-valued Decimals in an exact context.  libmpdec multiplies
+#            big numbers with a number-theoretic transform and prints them in
+#            linear time, so without gmpy2 this beats Python int (Karatsuba,
+#            quadratic int -> str) from ~100k digits on.
+#   int      plain Python int, for reference
+
+# python pichudnovsky.py --digits 1000000
+# python pichudnovsky.py --digits 10000000 --workers 8 --out pi.txt
+
+DIGITS_PER_TERM = math.log10(640320 ** 3 / 1728)    # ≈ 14.18
+C3_OVER_24 = 640320 ** 3 // 24
+GUARD = 10
+CHECK_DIGITS = 20000          # digits compared against pinewton_mp
+
+
+def exact_context():
+    """Decimal context in which integer +, - and * never round."""
+    ctx = Context(prec=MAX_PREC, Emax=MAX_EMAX, Emin=MIN_EMIN)
+    ctx.traps[Inexact] = True
+    return localcontext(ctx)
+
+
+class IntBackend:
+    name = "int"
+    num = staticmethod(int)
+
+    def context(self):
+        return nullcontext()
+
+    def finish(self, q, t, digits):
+        one = 10 ** (digits + GUARD)
+        sqrt_c = math.isqrt(10005 * one * one)
+        pi = 426880 * sqrt_c * q // t
+        s = str(Decimal(pi))          # int -> str is capped at 4300 digits
+        return f"{s[0]}.{s[1:digits + 1]}"
+
+
+class GmpyBackend(IntBackend):
+    name = "gmpy2"
+    num = staticmethod(gmpy2.mpz) if gmpy2 else None
+
+    def finish(self, q, t, digits):
+        one = gmpy2.mpz(10) ** (digits + GUARD)
+        sqrt_c = gmpy2.isqrt(10005 * one * one)
+        s = str(426880 * sqrt_c * q // t)
+        return f"{s[0]}.{s[1:digits + 1]}"
+
+
+class DecimalBackend:
+    name = "decimal"
+    num = staticmethod(Decimal)
+
+    def context(self):
+        return exact_context()
+
+    def finish(self, q, t, digits):
+        prec = digits + GUARD
+        # Q and T have more than Emax digits, so widen the exponent range
+        with localcontext(Context(prec=prec, Emax=MAX_EMAX, Emin=MIN_EMIN)) as ctx:
+            # 1/sqrt(10005) by Newton with doubling precision (no Decimal.sqrt)
+            y = Decimal(1 / math.sqrt(10005))
+            for p in reversed(precision_schedule(prec)):
+                ctx.prec = p
+                y += y * (1 - 10005 * y * y) / 2
+            ctx.prec = prec
+            pi = 426880 * 10005 * y * (+q) / (+t)
+        s = str(pi)
+        return s[:digits + 2]
+
+
+def precision_schedule(prec):
+    """prec, prec/2, prec/4, ... down to float precision."""
+    out = []
+    while prec > 15:
+        out.append(prec + GUARD)
+        prec = (prec + 1) // 2
+    return out
+
+
+BACKENDS = {"gmpy2": GmpyBackend, "decimal": DecimalBackend, "int": IntBackend}
+
+
+def make_backend(name="auto"):
+    if name == "auto":
+        name = "gmpy2" if gmpy2 is not None else "decimal"
+    if name == "gmpy2" and gmpy2 is None:
+        raise ImportError("the gmpy2 backend needs `pip install gmpy2`")
+    return BACKENDS[name]()
+
+
+def bs(a, b, num):
+    """(P, Q, T) of terms [a, b); `num` converts small ints to the backend type."""
+    if b - a == 1:
+        if a == 0:
+            p = q = num(1)
+        else:
+            p = num((6 * a - 5) * (2 * a - 1) * (6 * a - 1))
+            q = num(a * a * a * C3_OVER_24)
+        t = p * num(13591409 + 545140134 * a)
+        return p, q, -t if a & 1 else t
+    m = (a + b) // 2
+    return merge(bs(a, m, num), bs(m, b, num))
+
+
+def merge(left, right):
+    """Combine (P, Q, T) of [a, m) and [m, b) into [a, b)."""
+    p1, q1, t1 = left
+    p2, q2, t2 = right
+    return p1 * p2, q1 * q2, q2 * t1 + p1 * t2
+
+
+def split_range(backend_name, a, b):
+    """Worker entry point: binary splitting over [a, b)."""
+    backend = make_backend(backend_name)
+    with backend.context():
+        return bs(a, b, backend.num)
+
+
+def chudnovsky_pi(digits, workers=None, backend="auto"):
+    """PI to `digits` decimals.
+
+    Returns (digit string "3.14...", {phase: seconds}).
+    """
+    be = make_backend(backend)
+    terms = int(digits / DIGITS_PER_TERM) + 2
+    workers = workers or os.cpu_count() or 1
+    # A few ranges per worker; equal term counts, so roughly equal work
+    parts = max(1, min(terms, workers * 2 if workers > 1 else 1))
+    edges = [terms * i // parts for i in range(parts + 1)]
+    times = {}
+
+    start = time.perf_counter()
+    if parts == 1:
+        pieces = [split_range(be.name, 0, terms)]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            pieces = list(pool.map(split_range, [be.name] * parts, edges[:-1], edges[1:]))
+    times["split"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    with be.context():
+        # Pairwise so both operands of each product have similar size
+        while len(pieces) > 1:
+            pieces = [merge(pieces[i], pieces[i + 1]) if i + 1 < len(pieces) else pieces[i]
+                      for i in range(0, len(pieces), 2)]
+    _, q, t = pieces[0]
+    times["merge"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = be.finish(q, t, digits)
+    times["finish"] = time.perf_counter() - start
+    return result, times
+
+
+def check_against_newton(result, digits=CHECK_DIGITS):
+    """Compare the leading digits with pinewton_mp's Newton iteration."""
+    from pinewton_mp import newton_pi, agreeing_digits
+    digits = min(digits, len(result) - 2)
+    ref, _ = newton_pi(digits)
+    return agreeing_digits(result[:digits + 2], ref), digits
+
+
+def parse_args():
+    p = argparse.ArgumentParser(description="PI by the Chudnovsky series with binary splitting")
+    p.add_argument("--digits",  type=int, default=1_000_000, help="Decimal digits of PI")
+    p.add_argument("--workers", type=int, default=None, help="Worker processes (default: all cores)")
+    p.add_argument("--backend", default="auto", choices=["auto"] + list(BACKENDS),
+                   help="Big-number backend (auto: gmpy2 if installed, else decimal)")
+    p.add_argument("--check",   type=int, default=CHECK_DIGITS,
+                   help="Digits to verify against the Newton iteration (0: skip)")
+    p.add_argument("--out",     default=None, help="Write the digits to this file")
+    return p.parse_args()
+
+
+def main():
+    args = parse_args()
+    total = time.perf_counter()
+    result, times = chudnovsky_pi(args.digits, args.workers, args.backend)
+    total = time.perf_counter() - total
+
+    print(f"Backend: {make_backend(args.backend).name} | digits: {args.digits}")
+    for phase, seconds in times.items():
+        print(f"  {phase:<8}{seconds:>10.3f} s")
+    print(f"  {'total':<8}{total:>10.3f} s")
+    print(f"{result[:52]}...{result[-10:]}")
+
+    if args.check:
+        start = time.perf_counter()
+        ok, n = check_against_newton(result, args.check)
+        print(f"Newton check: {ok} of {n} digits agree ({time.perf_counter() - start:.2f} s)"
+              + ("" if ok >= n else " -- MISMATCH"))
+    if args.out:
+        with open(args.out, "w") as fh:
+            fh.write(result + "\n")
+        print(f"Wrote {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+import argparse
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from pimonte_engine import count_hits
+
+# Exact lattice-point (Gauss circle) PI reference
+# -----------------------------------------------
+# N(R) = #{(x, y) in Z^2 : x^2 + y^2 <= R^2} = sum over x of 2*isqrt(R^2 - x^2) + 1,
+# and PI ≈ N(R) / R^2 with error O(R^-1.3) or so.  The column sums are done
+# in NumPy chunks and the chunks are spread over a process pool.  R^2 must
+# fit in int64, so R is limited to about 3e9.
+
+# python pilattice.py --radius 1e9
+# python pilattice.py --compare        # accuracy per CPU second vs Monte Carlo
+
+CHUNK = 1 << 22      # columns per chunk
+MAX_RADIUS = 3_000_000_000
+
+
+def isqrt(n):
+    """Vectorized floor(sqrt(n)) for non-negative int64 arrays."""
+    s = np.sqrt(n.astype(np.float64)).astype(np.int64)
+    # float64 can be off by one either way for n near 2^63
+    s -= s * s > n
+    s += (s + 1) * (s + 1) <= n
+    return s
+
+
+def column_sum(radius, start, stop):
+    """Sum of (2*isqrt(R^2 - x^2) + 1) for x in [start, stop).
+
+    Returns (sum, cpu_seconds) so callers can account for worker CPU time.
+    """
+    cpu = time.process_time()
+    r2 = np.int64(radius) * np.int64(radius)
+    total = 0
+    for lo in range(start, stop, CHUNK):
+        x = np.arange(lo, min(lo + CHUNK, stop), dtype=np.int64)
+        total += int((2 * isqrt(r2 - x * x) + 1).sum())
+    return total, time.process_time() - cpu
+
+
+def count_lattice_points(radius, workers=None):
+    """Exact N(R). Returns (count, cpu_seconds summed over all processes)."""
+    radius = int(radius)
+    if not 0 <= radius <= MAX_RADIUS:
+        raise ValueError(f"radius must be between 0 and {MAX_RADIUS}")
+    workers = workers or os.cpu_count() or 1
+    # Columns x = 1..R; the x = 0 column and the mirror image are added below
+    step = max(CHUNK, -(-radius // (workers * 4)))
+    ranges = [(lo, min(lo + step, radius + 1)) for lo in range(1, radius + 1, step)]
+    if workers == 1 or len(ranges) <= 1:
+        parts = [column_sum(radius, lo, hi) for lo, hi in ranges]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = list(pool.map(column_sum, [radius] * len(ranges),
+                                  *zip(*ranges)))
+    half = sum(p[0] for p in parts)
+    cpu = sum(p[1] for p in parts)
+    return 2 * radius + 1 + 2 * half, cpu
+
+
+def lattice_pi(radius, workers=None):
+    """Return (pi_estimate, count, cpu_seconds) for radius R."""
+    if int(radius) < 1:
+        raise ValueError("radius must be at least 1 to estimate PI")
+    count, cpu = count_lattice_points(radius, workers)
+    return count / radius ** 2, count, cpu
+
+
+def monte_carlo_for(cpu_seconds, seed=None):
+    """Monte Carlo PI with (at least) the given CPU time: (pi, trials, cpu)."""
+    rng = np.random.default_rng(seed)
+    inside = total = 0
+    start = time.process_time()
+    while True:
+        i, n = count_hits(rng, 1 << 20)
+        inside += i
+        total += n
+        used = time.process_time() - start
+        if used >= cpu_seconds:
+            return 4 * inside / total, total, used
+
+
+def digits(err):
+    return -math.log10(err) if err > 0 else float("inf")
+
+
+def parse_args():
+    p = argparse.ArgumentParser(description="Exact Gauss circle lattice count as a PI reference")
+    p.add_argument("--radius",  type=float, default=1e7, help="Circle radius R (up to 3e9)")
+    p.add_argument("--workers", type=int,   default=None, help="Worker processes (default: all cores)")
+    p.add_argument("--compare", action="store_true",
+                   help="Compare accuracy per CPU second with the Monte Carlo sampler")
+    p.add_argument("--seed",    type=int,   default=None, help="Seed for the Monte Carlo comparison")
+    return p.parse_args()
+
+
+def main():
+    args = parse_args()
+    if not args.compare:
+        t0 = time.perf_counter()
+        pi_est, count, cpu = lattice_pi(int(args.radius), args.workers)
+        wall = time.perf_counter() - t0
+        print(f"R = {int(args.radius)} | N(R) = {count}")
+        print(f"PI ≈ {pi_est:.15f} (error {pi_est - math.pi:+.2e}, {digits(abs(pi_est - math.pi)):.1f} digits)")
+        print(f"Wall: {wall:.2f} s | CPU: {cpu:.2f} s")
+        return
+
+    print(f"{'R':>12}{'CPU s':>9}{'lattice err':>13}{'digits':>8}{'MC trials':>14}{'MC err':>11}{'digits':>8}")
+    radius = 1000
+    while radius <= args.radius:
+        pi_lat, _, cpu = lattice_pi(radius, args.workers)
+        # Give Monte Carlo the same CPU time (with a floor so timing is meaningful)
+        pi_mc, trials, _ = monte_carlo_for(max(cpu, 0.01), args.seed)
+        err_lat, err_mc = abs(pi_lat - math.pi), abs(pi_mc - math.pi)
+        print(f"{radius:>12}{cpu:>9.3f}{err_lat:>13.2e}{digits(err_lat):>8.1f}"
+              f"{trials:>14}{err_mc:>11.2e}{digits(err_mc):>8.1f}")
+        radius *= 10
+
+
+if __name__ == "__main__":
+    main()
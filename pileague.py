@@ -0,0 +1,253 @@
+import argparse
+import json
+import math
+import time
+
+import numpy as np
+
+from pimonte_engine import count_hits
+from pimonte_samplers import SobolSampler
+from pinewton import newton_raphson
+
+# PI estimator benchmark league
+# -----------------------------
+# Every method implements the same small interface: run(budget) computes the
+# result for a method-specific budget (samples, iterations or series terms),
+# and score(result, budget) turns it into (estimate, digits) -- digits =
+# -log10|estimate - PI|.  Only run() is timed.  The runner climbs a
+# geometric budget ladder per method, records digits of accuracy against
+# wall-clock and CPU time, and prints a table plus the cheapest method for
+# each accuracy target.
+
+# python pileague.py --max-time 5 --json league.json
+
+FLOAT_FLOOR = math.ulp(math.pi) / 2     # best possible float64 error
+
+
+class Estimator:
+    """Base interface: a name, a budget ladder, run(budget) and score()."""
+
+    name = "base"
+    unit = "steps"
+    budgets = ()
+
+    def __init__(self, seed=None):
+        self.seed = seed
+
+    def run(self, budget):
+        """The raw result for the given budget (this is what gets timed)."""
+        raise NotImplementedError
+
+    def score(self, result, budget):
+        """Return (estimate, digits of accuracy) for a run() result."""
+        raise NotImplementedError
+
+
+class FloatEstimator(Estimator):
+    """Estimator whose result is a float64; errors are floored at 1/2 ulp."""
+
+    def run(self, budget):
+        return float(self.estimate(budget))
+
+    def score(self, result, budget):
+        return result, -math.log10(max(abs(result - math.pi), FLOAT_FLOOR))
+
+    def estimate(self, budget):
+        raise NotImplementedError
+
+
+class MonteCarlo(FloatEstimator):
+    name = "monte-carlo"
+    unit = "samples"
+    budgets = [4 ** k for k in range(5, 18)]
+
+    def __init__(self, seed=None):
+        super().__init__(seed)
+        self.rng = np.random.default_rng(seed)
+
+    def estimate(self, budget):
+        inside, total = count_hits(self.rng, budget)
+        return 4 * inside / total
+
+
+class QuasiMonteCarlo(FloatEstimator):
+    name = "sobol-qmc"
+    unit = "samples"
+    budgets = [4 ** k for k in range(5, 16)]
+
+    def estimate(self, budget):
+        return SobolSampler(self.seed).estimate(budget)[0]
+
+
+class BuffonNeedle(FloatEstimator):
+    """Needles of length 1 dropped on lines 1 apart: P(cross) = 2/PI.
+
+    The needle direction comes from a point accepted in the unit quarter
+    disc, so PI itself is never used to generate the angle.
+    """
+
+    name = "buffon"
+    unit = "needles"
+    budgets = [4 ** k for k in range(5, 17)]
+    block = 1 << 20
+
+    def __init__(self, seed=None):
+        super().__init__(seed)
+        self.rng = np.random.default_rng(seed)
+
+    def estimate(self, budget):
+        crossings = dropped = 0
+        while dropped < budget:
+            m = min(self.block, budget - dropped)
+            # Sample a few extra directions to cover the rejected ones
+            a, b = self.rng.random((2, m * 4 // 3 + 16))
+            r2 = a * a + b * b
+            keep = (r2 <= 1) & (r2 > 0)
+            sin_theta = (b[keep] / np.sqrt(r2[keep]))[:m]
+            centre = self.rng.random(len(sin_theta)) / 2   # distance to nearest line
+            crossings += int(np.count_nonzero(centre <= sin_theta / 2))
+            dropped += len(sin_theta)
+        return 2 * dropped / crossings
+
+
+class NewtonTan(FloatEstimator):
+    """pinewton's Newton iteration on tan(x/4) - 1 from x0 = 3."""
+
+    name = "newton-tan"
+    unit = "iterations"
+    budgets = list(range(1, 9))
+
+    def estimate(self, budget):
+        return newton_raphson(3.0, tol=0, max_iter=budget)[-1]
+
+
+class Leibniz(FloatEstimator):
+    """PI = 4 * (1 - 1/3 + 1/5 - ...), summed in NumPy blocks."""
+
+    name = "leibniz"
+    unit = "terms"
+    budgets = [4 ** k for k in range(2, 15)]
+    block = 1 << 20
+
+    def estimate(self, budget):
+        total = 0.0
+        for start in range(0, budget, self.block):
+            k = np.arange(start, min(start + self.block, budget), dtype=np.float64)
+            total += float(np.sum(np.where(k % 2 == 0, 1.0, -1.0) / (2 * k + 1)))
+        return 4 * total
+
+
+def arctan_inv(x, one, terms):
+    """Fixed-point arctan(1/x) * one from the first `terms` series terms."""
+    power = one // x
+    total = power
+    x2 = x * x
+    for k in range(1, terms):
+        power //= x2
+        term = power // (2 * k + 1)
+        total += -term if k % 2 else term
+    return total
+
+
+class Machin(Estimator):
+    """PI = 16 arctan(1/5) - 4 arctan(1/239) in exact integer fixed point."""
+
+    name = "machin"
+    unit = "terms"
+    budgets = [2 ** k for k in range(1, 16)]
+
+    @staticmethod
+    def digits_for(terms):
+        # arctan(1/5) gains log10(25) ≈ 1.4 digits per term
+        return int(terms * math.log10(25)) + 10
+
+    @classmethod
+    def fixed(cls, terms, digits):
+        one = 10 ** digits
+        return 16 * arctan_inv(5, one, terms) - 4 * arctan_inv(239, one, (terms + 2) // 3 + 1)
+
+    def run(self, budget):
+        return self.fixed(budget, self.digits_for(budget))
+
+    def score(self, value, budget):
+        digits = self.digits_for(budget)
+        # Reference: many more terms at the same precision (not timed)
+        ref = self.fixed(budget * 2 + 10, digits)
+        # Errors far below float range, so work with logs of the integers;
+        # the last few fixed-point digits carry rounding noise
+        diff = max(abs(value - ref), 10 ** 5)
+        return value / 10 ** digits, digits - math.log10(diff)
+
+
+METHODS = {cls.name: cls for cls in (MonteCarlo, QuasiMonteCarlo, BuffonNeedle, NewtonTan, Leibniz, Machin)}
+
+
+def measure(estimator, budget):
+    """Run once and return a result row; only run() is timed, not scoring."""
+    wall0, cpu0 = time.perf_counter(), time.process_time()
+    result = estimator.run(budget)
+    wall, cpu = time.perf_counter() - wall0, time.process_time() - cpu0
+    est, digits = estimator.score(result, budget)
+    return {"method": estimator.name, "budget": budget, "unit": estimator.unit,
+            "estimate": est, "digits": digits, "wall_s": wall, "cpu_s": cpu}
+
+
+def run_league(names, max_time, seed=None):
+    """Climb each method's budget ladder until one run exceeds max_time."""
+    rows = []
+    for name in names:
+        cls = METHODS[name]
+        est = cls(seed)
+        for budget in cls.budgets:
+            row = measure(est, budget)
+            rows.append(row)
+            if row["wall_s"] > max_time:
+                break
+    return rows
+
+
+def best_per_target(rows, targets):
+    """For each digit target, the row reaching it with the least wall time."""
+    best = {}
+    for target in targets:
+        ok = [r for r in rows if r["digits"] >= target]
+        best[target] = min(ok, key=lambda r: r["wall_s"]) if ok else None
+    return best
+
+
+def parse_args():
+    p = argparse.ArgumentParser(description="Benchmark PI estimators: digits of accuracy vs time")
+    p.add_argument("--methods",  nargs="+", default=list(METHODS), choices=list(METHODS))
+    p.add_argument("--max-time", type=float, default=2.0, help="Stop a method's ladder after a run this long (s)")
+    p.add_argument("--targets",  type=float, nargs="+", default=[2, 4, 6, 9, 12, 15, 50],
+                   help="Accuracy targets in digits for the summary")
+    p.add_argument("--seed",     type=int,   default=None, help="Seed for the stochastic methods")
+    p.add_argument("--json",     default=None, help="Write all results to this JSON file")
+    return p.parse_args()
+
+
+def main():
+    args = parse_args()
+    rows = run_league(args.methods, args.max_time, args.seed)
+
+    print(f"{'method':<12}{'budget':>12} {'unit':<11}{'estimate':>20}{'digits':>10}{'wall s':>10}{'cpu s':>10}")
+    for r in rows:
+        print(f"{r['method']:<12}{r['budget']:>12} {r['unit']:<11}{r['estimate']:>20.15f}"
+              f"{r['digits']:>10.2f}{r['wall_s']:>10.4f}{r['cpu_s']:>10.4f}")
+
+    best = best_per_target(rows, args.targets)
+    print("\nCheapest method per accuracy target:")
+    for target, r in best.items():
+        choice = (f"{r['method']} ({r['budget']} {r['unit']}, {r['wall_s']:.4f} s)"
+                  if r else "not reached")
+        print(f"  {target:>5g} digits: {choice}")
+
+    if args.json:
+        with open(args.json, "w") as fh:
+            json.dump({"results": rows,
+                       "best": {str(t): r for t, r in best.items()}}, fh, indent=2)
+        print(f"\nWrote {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,20 @@
+import argparse
 import pygame
-import random
 import math
 import sys
+import time
+import numpy as np
+from pimonte_engine import BatchSampler, ConvergenceSeries, ConfidenceStop, wilson_interval
+from pimonte_samplers import make_sampler
+from pimonte_checkpoint import save_checkpoint, load_checkpoint
 
 # Monte Carlo PI Simulation with Continuous In-Pygame Convergence Plot
 # ---------------------------------------------------------------------
 # Points appear in left panel; continuous convergence line in right panel.
 
+# python pimonte.py                  # fresh run, checkpoints to CHECKPOINT_FILE
+# python pimonte.py --resume         # continue the run stored in CHECKPOINT_FILE
+
 # Settings
 SIM_SIZE = 600           # Simulation square size
 CIRCLE_SCALE = 0.8       # Circle scale factor (0<scale<=1)
@@ -17,9 +25,20 @@ RADIUS = int(BASE_RADIUS * CIRCLE_SCALE)
 CX, CY = BASE_RADIUS, BASE_RADIUS
 AUTO_STOP_TRIALS = 150000 # 0 to disable auto-stop
 # AUTO_STOP_TRIALS = 0 # 0 to disable auto-stop
+TARGET_ERROR = 0.005     # stop once the PI confidence half-width is below this (0: use AUTO_STOP_TRIALS)
+CONFIDENCE = 0.95        # confidence level for TARGET_ERROR
+BLOCK_SIZE = 4096        # points sampled per vectorized block
+FRAME_BUDGET = 1 / 30    # seconds of sampling per frame; 0 for one block per frame
+SEED = None              # RNG seed (None for a fresh run)
+SAMPLER = "random"       # random, antithetic, stratified, halton or sobol
+REFRESH_RATE = 30        # display flushes per second (0 to flush every frame)
+CHECKPOINT_FILE = "pimonte_checkpoint.npz"
+CHECKPOINT_EVERY = 10.0  # seconds between checkpoints (0 to disable)
 
 # Graph axis bounds
 y_min, y_max = 3.0, 3.3
+GRAPH_COLUMNS = GRAPH_WIDTH - 60   # one convergence bucket per graph pixel column
+GRAPH_SPAN = 10000                 # initial x-axis span when auto-stop is disabled
 
 # Colors
 WHITE   = (255, 255, 255)
@@ -27,6 +46,7 @@ BLACK   = (0, 0, 0)
 RED     = (255, 0, 0)
 GREEN   = (0, 255, 0)
 BLUE    = (0, 0, 255)
+LIGHT_BLUE = (190, 200, 255)
 
 
 def init_pygame():
@@ -66,63 +86,223 @@ def draw_static(screen, small_font):
     screen.blit(small_font.render("π", True, RED), (y_axis_x+5, pi_line_y-15))
     # Instructions
     screen.blit(small_font.render("SPACE to stop simulation", True, BLACK), (graph_x+10, HEIGHT-20))
-    screen.blit(small_font.render(f"Auto-stop: {AUTO_STOP_TRIALS}", True, BLACK), (graph_x+10, HEIGHT-40))
+    screen.blit(small_font.render(stop_label(), True, BLACK), (graph_x+10, HEIGHT-40))
     pygame.display.flip()
 
 
-def generate_point():
-    return random.uniform(0, SIM_SIZE), random.uniform(0, SIM_SIZE)
+def stop_label():
+    if TARGET_ERROR > 0:
+        return f"Auto-stop: ±{TARGET_ERROR} @ {CONFIDENCE:.0%}"
+    return f"Auto-stop: {AUTO_STOP_TRIALS}"
+
+
+class RenderScheduler:
+    """Coalesce drawing into one display update per refresh interval.
+
+    Callers mark() the rectangles they changed on the screen surface and
+    defer() redraws of things that only need their latest state (status
+    text, graph).  flush() runs the deferred redraws once, then pushes all
+    dirty rectangles to the display in a single pygame.display.update.
+    """
+
+    def __init__(self, refresh_rate=REFRESH_RATE):
+        self.period = 1 / refresh_rate if refresh_rate > 0 else 0
+        self.next_flush = 0.0
+        self.rects = []
+        self.pending = {}
+
+    def mark(self, rect):
+        self.rects.append(pygame.Rect(rect))
+
+    def defer(self, key, draw, *args):
+        # A later request with the same key replaces the earlier one;
+        # `draw` must return the rectangle it touched (or None)
+        self.pending[key] = (draw, args)
+
+    def flush(self, force=False):
+        now = time.perf_counter()
+        if not force and now < self.next_flush:
+            return False
+        for draw, args in self.pending.values():
+            rect = draw(*args)
+            if rect is not None:
+                self.mark(rect)
+        self.pending.clear()
+        if self.rects:
+            pygame.display.update(self.rects)
+            self.rects.clear()
+        self.next_flush = now + self.period
+        return True
+
 
+class HitBuffer:
+    """Per-pixel hit counts for the simulation square.
 
-def is_inside(x, y):
-    return math.hypot(x-CX, y-CY) <= RADIUS
+    Two uint32 channels (inside, outside) indexed [x, y] like
+    pygame.surfarray, filled in bulk with one bincount per block, so repeated
+    hits on a pixel are kept and memory does not grow with the trial count.
+    """
 
+    def __init__(self, size=SIM_SIZE):
+        self.size = size
+        self.counts = np.zeros((2, size, size), dtype=np.uint32)
 
-def draw_point(screen, x, y, inside):
-    screen.set_at((int(x), int(y)), GREEN if inside else RED)
-    # update that pixel
-    pygame.display.update((int(x), int(y), 1, 1))
+    def add(self, xs, ys, inside):
+        ix = np.minimum(xs.astype(np.intp), self.size-1)
+        iy = np.minimum(ys.astype(np.intp), self.size-1)
+        # channel 0 = inside, 1 = outside
+        idx = (~inside) * (self.size*self.size) + ix*self.size + iy
+        self.counts += np.bincount(idx, minlength=self.counts.size).astype(np.uint32) \
+            .reshape(self.counts.shape)
 
 
-def update_status(screen, font, inside_count, total_count):
+def density_ramp(color):
+    # 256-entry lookup table from white (no hits) to `color` (densest pixel)
+    t = np.linspace(0, 1, 256)[:, None]
+    return 255 - t * (255 - np.array(color, dtype=float))
+
+
+HEAT_LUT = (density_ramp((0, 150, 0)), density_ramp((200, 0, 0)))
+
+
+def draw_heatmap(screen, hits):
+    # Colour every pixel by its log hit density and blit the whole square at once
+    counts = hits.counts
+    scale = 255 / np.log1p(max(int(counts.max()), 1))
+    rgb = np.full((hits.size, hits.size, 3), 255.0)
+    for channel, lut in zip(counts, HEAT_LUT):
+        level = (np.log1p(channel) * scale).astype(np.uint8)
+        rgb -= 255 - lut[level]
+    sim = screen.subsurface((0, 0, SIM_SIZE, SIM_SIZE))
+    pygame.surfarray.blit_array(sim, np.clip(rgb, 0, 255).astype(np.uint8))
+    pygame.draw.rect(screen, BLACK, (0, 0, SIM_SIZE, SIM_SIZE), 1)
+    pygame.draw.circle(screen, BLACK, (CX, CY), RADIUS, 1)
+    return (0, 0, SIM_SIZE, SIM_SIZE)
+
+
+def update_status(screen, font, inside_count, total_count, half_width=None):
     # Account for circle scaling: pi ≈ (inside/total)*(4/scale^2)
     factor = 4/(CIRCLE_SCALE**2)
     pi_est = inside_count/total_count*factor if total_count else 0
     screen.fill(WHITE, (10, 10, SIM_SIZE-20, 20))
-    text = font.render(f"PI ≈ {pi_est:.6f} | Trials: {total_count}", True, BLACK)
+    ci = f" ± {half_width:.6f}" if half_width is not None else ""
+    text = font.render(f"PI ≈ {pi_est:.6f}{ci} | Trials: {total_count}", True, BLACK)
     screen.blit(text, (10, 10))
-    pygame.display.update((0, 0, SIM_SIZE, 40))
-    return pi_est
+    return (0, 0, SIM_SIZE, 40)
+
 
+def graph_y(val):
+    # Map a PI value to a graph pixel row, clipped to the plot area
+    y = 10 + int((y_max-val)/(y_max-y_min)*(HEIGHT-40))
+    return min(max(y, 10), HEIGHT-30)
 
-def plot_graph_point(screen, small_font, pi_val, count, prev):
-    # Continuous plotting using AUTO_STOP_TRIALS for x-scale
-    if AUTO_STOP_TRIALS <= 0:
-        return prev
+
+def clear_graph(screen, small_font, span):
+    # Wipe the plot area (inside the axes) and redraw the PI line and labels
     graph_x = SIM_SIZE
     y_axis_x = graph_x + 40
-    # X coordinate
-    x = y_axis_x + int((count/AUTO_STOP_TRIALS)*(GRAPH_WIDTH-60))
-    # Y coordinate
-    y = 10 + int((y_max-pi_val)/(y_max-y_min)*(HEIGHT-40))
-    if prev is not None:
-        pygame.draw.line(screen, BLUE, prev, (x, y), 1)
-        # update around line
-        rect = pygame.Rect(min(prev[0], x)-1, min(prev[1], y)-1,
-                           abs(x-prev[0])+2, abs(y-prev[1])+2)
-        pygame.display.update(rect)
-    else:
-        screen.set_at((x, y), BLUE)
-        pygame.display.update((x, y, 1, 1))
-    return (x, y)
+    screen.fill(WHITE, (y_axis_x+1, 0, GRAPH_WIDTH-41, HEIGHT-31))
+    pi_line_y = graph_y(math.pi)
+    pygame.draw.line(screen, RED, (y_axis_x+1, pi_line_y), (graph_x+GRAPH_WIDTH-10, pi_line_y), 1)
+    screen.blit(small_font.render("π", True, RED), (y_axis_x+5, pi_line_y-15))
+    # The label sits below the wiped area and crosses the axes: clear its
+    # full row, redraw the axis pieces under it, then draw the new text
+    lbl = small_font.render(f"{stop_label()} | x-span: {span}", True, BLACK)
+    screen.fill(WHITE, (graph_x+1, HEIGHT-40, GRAPH_WIDTH-2, lbl.get_height()))
+    x_axis_y = HEIGHT - 30
+    pygame.draw.line(screen, BLACK, (y_axis_x, HEIGHT-40), (y_axis_x, x_axis_y), 2)
+    pygame.draw.line(screen, BLACK, (y_axis_x, x_axis_y), (graph_x+GRAPH_WIDTH-10, x_axis_y), 2)
+    screen.blit(lbl, (graph_x+10, HEIGHT-40))
+    return (graph_x, 0, GRAPH_WIDTH, HEIGHT)
+
+
+def draw_ci_label(screen, small_font, half_width):
+    # Current confidence-interval width, top right of the graph panel
+    rect = (SIM_SIZE+120, 12, GRAPH_WIDTH-130, 16)
+    screen.fill(WHITE, rect)
+    lbl = small_font.render(f"{CONFIDENCE:.0%} CI ± {half_width:.5f}", True, BLUE)
+    screen.blit(lbl, rect[:2])
+    return rect
+
+
+def plot_graph(screen, small_font, series, band=None):
+    # Draw the convergence columns touched since the last call: a vertical
+    # min/max bar per pixel column, joined to the previous column's last value.
+    # `band` is an optional (lower, upper) pair of series drawn as a shaded
+    # confidence band behind the curve.  Returns the dirty rect.
+    if series.dirty is None:
+        return None
+    y_axis_x = SIM_SIZE + 40
+    first, last = series.dirty
+    if series.redraw:
+        clear_graph(screen, small_font, series.span)
+    prev_y = None
+    if first > 0 and not np.isnan(series.last[first-1]):
+        prev_y = graph_y(series.last[first-1])
+    for c in range(first, last+1):
+        if np.isnan(series.last[c]):
+            continue
+        x = y_axis_x + c
+        if band is not None and not np.isnan(band[0].last[c]):
+            pygame.draw.line(screen, LIGHT_BLUE, (x, graph_y(band[1].last[c])),
+                             (x, graph_y(band[0].last[c])), 1)
+        lo_y, hi_y = graph_y(series.lo[c]), graph_y(series.hi[c])
+        pygame.draw.line(screen, BLUE, (x, hi_y), (x, lo_y), 1)
+        if prev_y is not None:
+            pygame.draw.line(screen, BLUE, (x-1, prev_y), (x, min(max(prev_y, hi_y), lo_y)), 1)
+        prev_y = graph_y(series.last[c])
+    series.clear_dirty()
+    if band is not None:
+        band[0].clear_dirty()
+        band[1].clear_dirty()
+    if first == 0 and last == series.columns - 1:
+        return (SIM_SIZE, 0, GRAPH_WIDTH, HEIGHT)
+    return (y_axis_x + first - 1, 0, last - first + 3, HEIGHT-30)
+
+
+def parse_args():
+    p = argparse.ArgumentParser(description="Monte Carlo PI simulation with convergence plot")
+    p.add_argument("--checkpoint", default=CHECKPOINT_FILE, help="Checkpoint file to write (and resume from)")
+    p.add_argument("--resume",     action="store_true",     help="Continue the run saved in --checkpoint")
+    return p.parse_args()
 
 
 def main():
+    args = parse_args()
     screen, font, small_font, clock = init_pygame()
     draw_static(screen, small_font)
 
-    total = inside_count = 0
-    prev_gp = None
+    if args.resume:
+        inside_count, total, sampler_name, point_sampler, saved, arrays = \
+            load_checkpoint(args.checkpoint, make_sampler)
+        series = saved["estimate"]
+        band = (saved["ci_low"], saved["ci_high"])
+        hits = HitBuffer()
+        hits.counts[:] = arrays["hits"]
+    else:
+        sampler_name, point_sampler = SAMPLER, make_sampler(SAMPLER, SEED)
+        inside_count = total = 0
+        series = ConvergenceSeries(GRAPH_COLUMNS, AUTO_STOP_TRIALS or GRAPH_SPAN)
+        band = (ConvergenceSeries(GRAPH_COLUMNS, series.span),
+                ConvergenceSeries(GRAPH_COLUMNS, series.span))
+        hits = HitBuffer()
+    sampler = BatchSampler(SIM_SIZE, CX, CY, RADIUS, block=BLOCK_SIZE, sampler=point_sampler)
+    factor = 4/(CIRCLE_SCALE**2)
+    stopper = ConfidenceStop(TARGET_ERROR, CONFIDENCE, factor)
+    stopper.update(inside_count, total)
+    max_trials = 0 if TARGET_ERROR > 0 else AUTO_STOP_TRIALS
+
+    def checkpoint():
+        save_checkpoint(args.checkpoint, inside_count, total, sampler_name, point_sampler,
+                        {"estimate": series, "ci_low": band[0], "ci_high": band[1]},
+                        {"hits": hits.counts})
+
+    scheduler = RenderScheduler()
+    if total:
+        scheduler.defer("points", draw_heatmap, screen, hits)
+        scheduler.defer("status", update_status, screen, font, inside_count, total, stopper.half_width())
+        scheduler.defer("graph", plot_graph, screen, small_font, series, band)
+    next_checkpoint = time.perf_counter() + CHECKPOINT_EVERY
     running = True
 
     while running:
@@ -130,24 +310,50 @@ def main():
             if ev.type == pygame.QUIT or \
                (ev.type == pygame.KEYDOWN and ev.key == pygame.K_SPACE):
                 running = False
-        if AUTO_STOP_TRIALS and total >= AUTO_STOP_TRIALS:
+        if (max_trials and total >= max_trials) or stopper.done:
             running = False
 
         if not running:
             break
 
-        # Monte Carlo step
-        x, y = generate_point()
-        inside = is_inside(x, y)
-        total += 1
-        inside_count += inside
+        # Monte Carlo step: one or more vectorized blocks per frame
+        limit = max_trials - total if max_trials else None
+        if FRAME_BUDGET > 0:
+            batches = sampler.sample_for(FRAME_BUDGET, limit)
+        else:
+            batches = [sampler.sample(min(BLOCK_SIZE, limit or BLOCK_SIZE))]
+        for xs, ys, inside in batches:
+            # Running estimate after every sample of the block
+            counts = total + np.arange(1, len(xs)+1)
+            running_hits = inside_count + np.cumsum(inside)
+            series.add_many(counts, running_hits / counts * factor)
+            lo, hi = wilson_interval(running_hits, counts, stopper.z)
+            band[0].add_many(counts, lo * factor)
+            band[1].add_many(counts, hi * factor)
+            total += len(xs)
+            inside_count += int(inside.sum())
+            stopper.update(int(inside.sum()), len(xs))
 
-        draw_point(screen, x, y, inside)
-        pi_est = update_status(screen, font, inside_count, total)
-        prev_gp = plot_graph_point(screen, small_font, pi_est, total, prev_gp)
+            half_width = stopper.half_width()
+            hits.add(xs, ys, inside)
+            scheduler.defer("points", draw_heatmap, screen, hits)
+            scheduler.defer("status", update_status, screen, font, inside_count, total, half_width)
+            scheduler.defer("graph", plot_graph, screen, small_font, series, band)
+            scheduler.defer("ci", draw_ci_label, screen, small_font, half_width)
+            if stopper.done:
+                running = False
+                break
 
+        scheduler.flush()
+        if CHECKPOINT_EVERY > 0 and time.perf_counter() >= next_checkpoint:
+            checkpoint()
+            next_checkpoint = time.perf_counter() + CHECKPOINT_EVERY
         clock.tick(0)
 
+    scheduler.flush(force=True)
+    if CHECKPOINT_EVERY > 0:
+        checkpoint()
+
     # Pause until close or SPACE again
     paused = True
     while paused:
@@ -1,21 +1,28 @@
 import pygame
-import random
 import math
 import sys
 import matplotlib.pyplot as plt
+from pimonte_engine import ConvergenceSeries, ConfidenceStop
+from pimonte_samplers import make_sampler
 
 # Monte Carlo PI Simulation with Auto-Stop, Manual Stop, and Convergence Plot
 # ---------------------------------------------------------------------------
 # The simulation runs until:
 #   - The user presses SPACE (manual stop)
-#   - A maximum number of trials (AUTO_STOP_TRIALS) is reached
+#   - The confidence interval on PI is narrower than TARGET_ERROR, or
+#     (with TARGET_ERROR = 0) a maximum number of trials (AUTO_STOP_TRIALS) is reached
 
 # Screen settings
 WIDTH, HEIGHT = 600, 600
 RADIUS = WIDTH // 2
 CX, CY = WIDTH // 2, HEIGHT // 2
 RECORD_EVERY = 1000       # record PI estimate every N trials
+PLOT_COLUMNS = 1000       # fixed number of min/max/last buckets in the plot
 AUTO_STOP_TRIALS = 50000  # set to 0 to disable auto-stop
+TARGET_ERROR = 0.02       # stop at this PI confidence half-width (0: use AUTO_STOP_TRIALS)
+CONFIDENCE = 0.95         # confidence level for TARGET_ERROR
+SAMPLER = "random"        # random, antithetic, stratified, halton or sobol
+SEED = None               # sampler seed (None for a fresh run)
 
 # Colors
 WHITE = (255, 255, 255)
@@ -39,15 +46,19 @@ def draw_static(screen):
     screen.fill(WHITE)
     pygame.draw.rect(screen, BLACK, (0, 0, WIDTH, HEIGHT), 1)
     pygame.draw.circle(screen, BLACK, (CX, CY), RADIUS, 1)
+    stop = (f"TARGET_ERROR={TARGET_ERROR} @ {CONFIDENCE:.0%}" if TARGET_ERROR > 0
+            else f"AUTO_STOP_TRIALS={AUTO_STOP_TRIALS}")
     instr = pygame.font.SysFont("Arial", 14).render(
-        f"SPACE: manual stop | AUTO_STOP_TRIALS={AUTO_STOP_TRIALS}", True, BLACK)
+        f"SPACE: manual stop | {stop}", True, BLACK)
     screen.blit(instr, (10, HEIGHT - 20))
     pygame.display.flip()
 
 
-def generate_point():
-    """Generate a random point within the square."""
-    return random.uniform(0, WIDTH), random.uniform(0, HEIGHT)
+def point_stream(sampler, block=1024):
+    """Generate points within the square from a pimonte_samplers sampler."""
+    while True:
+        us, vs = sampler.draw(block)
+        yield from zip((us * WIDTH).tolist(), (vs * HEIGHT).tolist())
 
 
 def is_inside_circle(x, y):
@@ -60,11 +71,11 @@ def draw_point(screen, x, y, inside):
     screen.set_at((int(x), int(y)), GREEN if inside else RED)
 
 
-def update_text(screen, font, inside_points, total_points):
-    """Update onscreen text with the latest PI estimate and trial count."""
+def update_text(screen, font, inside_points, total_points, half_width):
+    """Update onscreen text with the latest PI estimate, CI and trial count."""
     pi_est = 4 * inside_points / total_points if total_points else 0
-    pygame.draw.rect(screen, WHITE, (10, 10, 300, 20))
-    txt = font.render(f"PI ≈ {pi_est:.6f} | Trials: {total_points}", True, BLACK)
+    pygame.draw.rect(screen, WHITE, (10, 10, 400, 20))
+    txt = font.render(f"PI ≈ {pi_est:.6f} ± {half_width:.4f} | Trials: {total_points}", True, BLACK)
     screen.blit(txt, (10, 10))
     pygame.display.flip()
 
@@ -74,7 +85,9 @@ def main():
     draw_static(screen)
 
     total_points = inside_points = 0
-    trials, estimates = [], []
+    series = ConvergenceSeries(PLOT_COLUMNS, AUTO_STOP_TRIALS or RECORD_EVERY * PLOT_COLUMNS)
+    points = point_stream(make_sampler(SAMPLER, SEED))
+    stopper = ConfidenceStop(TARGET_ERROR, CONFIDENCE)
     running = True
 
     while running:
@@ -86,32 +99,38 @@ def main():
                 running = False
 
         # Auto-stop check
-        if AUTO_STOP_TRIALS > 0 and total_points >= AUTO_STOP_TRIALS:
+        if stopper.done:
+            break
+        if TARGET_ERROR <= 0 and AUTO_STOP_TRIALS > 0 and total_points >= AUTO_STOP_TRIALS:
             break
 
         # Monte Carlo sampling
-        x, y = generate_point()
+        x, y = next(points)
         inside = is_inside_circle(x, y)
         total_points += 1
         inside_points += inside
+        stopper.update(inside, 1)
 
         draw_point(screen, x, y, inside)
-        update_text(screen, font, inside_points, total_points)
+        update_text(screen, font, inside_points, total_points, stopper.half_width())
 
         # Record periodic estimate
         if total_points % RECORD_EVERY == 0:
-            estimates.append(4 * inside_points / total_points)
-            trials.append(total_points)
+            series.add(total_points, 4 * inside_points / total_points)
 
         clock.tick(0)
 
     pygame.quit()
 
-    # Plot convergence
+    # Plot convergence: last estimate per bucket, shaded min/max envelope
+    trials, estimates, lo, hi = series.arrays()
+    plt.fill_between(trials, lo, hi, alpha=0.3, label='Min/max per bucket')
     plt.plot(trials, estimates, label='Estimate')
     plt.axhline(math.pi, linestyle='--', label='True PI')
     plt.xlabel('Trials')
     plt.ylabel('Estimated PI')
+    lo, hi = stopper.interval()
+    plt.axhspan(lo, hi, alpha=0.15, color='green', label=f'Final {CONFIDENCE:.0%} CI')
     plt.title('PI Convergence via Monte Carlo')
     plt.legend()
     plt.show()
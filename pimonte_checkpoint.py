@@ -0,0 +1,87 @@
+import json
+import os
+import tempfile
+import numpy as np
+
+from pimonte_engine import ConvergenceSeries
+
+# Checkpoint files for long Monte Carlo PI runs
+# ---------------------------------------------
+# One compressed .npz holds the hit counts, the sampler name and its exact
+# RNG/sequence state (as JSON), any number of named convergence series and
+# optional extra named arrays (e.g. the per-pixel hit buffer).
+# Files are written to a temporary name first and then renamed over the
+# old checkpoint (then the directory is fsynced too), so a crash never
+# leaves a half-written file behind.
+
+FORMAT_VERSION = 1
+
+
+def save_checkpoint(path, inside, total, sampler_name, sampler, series=None, extra=None):
+    """Atomically write a checkpoint. `series` maps names to ConvergenceSeries,
+    `extra` maps names to plain arrays."""
+    arrays = {
+        "version": np.array(FORMAT_VERSION),
+        "counts": np.array([inside, total], dtype=np.int64),
+        "sampler": np.array(sampler_name),
+        "sampler_state": np.array(json.dumps(sampler.get_state())),
+    }
+    for name, s in (series or {}).items():
+        for key, value in s.get_state().items():
+            arrays[f"series/{name}/{key}"] = np.asarray(value)
+    for name, value in (extra or {}).items():
+        arrays[f"extra/{name}"] = np.asarray(value)
+
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp = tempfile.mkstemp(prefix=".pimonte-", suffix=".npz", dir=directory)
+    try:
+        # mkstemp creates the file 0600; give it the mode a plain open() would
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(tmp, 0o666 & ~umask)
+        with os.fdopen(fd, "wb") as fh:
+            np.savez_compressed(fh, **arrays)
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+    fsync_directory(directory)
+
+
+def fsync_directory(directory):
+    """Make a rename in `directory` durable (no-op where dirs can't be opened)."""
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+    fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def load_checkpoint(path, make_sampler):
+    """Read a checkpoint written by save_checkpoint.
+
+    `make_sampler(name)` builds a fresh sampler whose state is then restored.
+    Returns (inside, total, sampler_name, sampler, series_dict, extra_dict).
+    """
+    with np.load(path) as data:
+        version = int(data["version"])
+        if version != FORMAT_VERSION:
+            raise ValueError(f"{path}: unsupported checkpoint version {version}")
+        inside, total = (int(v) for v in data["counts"])
+        name = str(data["sampler"])
+        sampler = make_sampler(name)
+        sampler.set_state(json.loads(str(data["sampler_state"])))
+        grouped = {}
+        extra = {}
+        for key in data.files:
+            if key.startswith("series/"):
+                _, series_name, field = key.split("/")
+                grouped.setdefault(series_name, {})[field] = data[key]
+            elif key.startswith("extra/"):
+                extra[key[len("extra/"):]] = data[key]
+    series = {n: ConvergenceSeries.from_state(state) for n, state in grouped.items()}
+    return inside, total, name, sampler, series, extra
@@ -0,0 +1,259 @@
+import argparse
+import json
+import math
+import multiprocessing as mp
+import socket
+import socketserver
+import threading
+import time
+from collections import deque
+
+import numpy as np
+
+from pimonte_engine import count_hits
+
+# Localhost/LAN cluster mode for Monte Carlo PI
+# ---------------------------------------------
+# A coordinator hands out small trial batches over TCP; workers pull a batch,
+# count hits with the same vectorized is_inside test as pimonte_engine and
+# send back (inside, total).  Messages are newline-delimited JSON.
+#
+# Every batch has its own SeedSequence child, so a batch gives the same
+# counts whichever worker runs it.  A batch held by a worker that
+# disconnects goes straight back to the queue; once the queue is empty, idle
+# workers back up the oldest batch nobody else is duplicating (or any batch
+# in flight longer than --timeout) and the first result to arrive wins.
+
+# python pimonte_cluster.py --local 4 --trials 1e9
+# python pimonte_cluster.py --serve --port 5050 --trials 1e10
+# python pimonte_cluster.py --worker 127.0.0.1:5050
+
+DEFAULT_PORT = 5050
+BATCH = 1 << 22
+
+
+def send(sock_file, msg):
+    sock_file.write((json.dumps(msg) + "\n").encode())
+    sock_file.flush()
+
+
+def recv(sock_file):
+    line = sock_file.readline()
+    if not line:
+        raise ConnectionError("connection closed")
+    return json.loads(line)
+
+
+class Coordinator:
+    """Batch bookkeeping shared by all connection handlers."""
+
+    def __init__(self, trials, batch=BATCH, seed=None, timeout=30.0):
+        if trials < 1 or batch < 1:
+            raise ValueError("trials and batch must be at least 1")
+        self.sizes = [batch] * (trials // batch) + ([trials % batch] if trials % batch else [])
+        root = np.random.SeedSequence(seed)
+        self.seeds = [(root.entropy, list(child.spawn_key)) for child in root.spawn(len(self.sizes))]
+        self.pending = deque(range(len(self.sizes)))
+        self.in_flight = {}          # batch id -> {worker name: start time}
+        self.results = {}            # batch id -> (inside, total)
+        self.workers = {}            # name -> {"trials": n, "busy": seconds, "batches": k}
+        self.timeout = timeout
+        self.cond = threading.Condition()
+        self.start = time.perf_counter()
+        self.finished = None
+
+    @property
+    def done(self):
+        return len(self.results) == len(self.sizes)
+
+    def register(self, name):
+        with self.cond:
+            self.workers.setdefault(name, {"trials": 0, "busy": 0.0, "batches": 0})
+
+    def next_batch(self, name):
+        """Block until there is a batch for `name`; None once the run is done."""
+        with self.cond:
+            while not self.done:
+                if self.pending:
+                    bid = self.pending.popleft()
+                else:
+                    bid = self._steal(name)
+                if bid is not None:
+                    self.in_flight.setdefault(bid, {})[name] = time.perf_counter()
+                    return bid
+                self.cond.wait(0.1)
+            return None
+
+    def _steal(self, name):
+        # Oldest batch with a single holder, or one that has been out too long
+        now = time.perf_counter()
+        candidates = [(min(holders.values()), bid) for bid, holders in self.in_flight.items()
+                      if name not in holders
+                      and (len(holders) == 1 or now - min(holders.values()) >= self.timeout)]
+        return min(candidates)[1] if candidates else None
+
+    def complete(self, name, bid, inside, total, seconds):
+        with self.cond:
+            stats = self.workers[name]
+            stats["trials"] += total
+            stats["busy"] += seconds
+            stats["batches"] += 1
+            self.in_flight.pop(bid, None)
+            if bid not in self.results:
+                self.results[bid] = (inside, total)
+                if self.done:
+                    self.finished = time.perf_counter()
+            self.cond.notify_all()
+
+    def abandon(self, name, bid):
+        """Worker went away: put its batch back unless someone else has it."""
+        with self.cond:
+            holders = self.in_flight.get(bid)
+            if holders is None:
+                return
+            holders.pop(name, None)
+            if not holders:
+                del self.in_flight[bid]
+                if bid not in self.results:
+                    self.pending.appendleft(bid)
+            self.cond.notify_all()
+
+    def totals(self):
+        inside = sum(r[0] for r in self.results.values())
+        total = sum(r[1] for r in self.results.values())
+        return inside, total
+
+
+class Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        coord = self.server.coordinator
+        hello = recv(self.rfile)
+        name = hello.get("name") or f"{self.client_address[0]}:{self.client_address[1]}"
+        coord.register(name)
+        bid = None
+        try:
+            while True:
+                bid = coord.next_batch(name)
+                if bid is None:
+                    send(self.wfile, {"op": "done"})
+                    return
+                entropy, spawn_key = coord.seeds[bid]
+                send(self.wfile, {"op": "batch", "id": bid, "n": coord.sizes[bid],
+                                  "entropy": entropy, "spawn_key": spawn_key})
+                msg = recv(self.rfile)
+                coord.complete(name, msg["id"], msg["inside"], msg["total"], msg["seconds"])
+                bid = None
+        except (ConnectionError, OSError, ValueError):
+            if bid is not None:
+                coord.abandon(name, bid)
+
+
+class Server(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+
+
+def run_worker(address, name=None, delay=0.0):
+    """Connect to a coordinator and process batches until told to stop."""
+    host, port = address
+    with socket.create_connection((host, port)) as sock:
+        f = sock.makefile("rwb")
+        send(f, {"op": "hello", "name": name or f"{socket.gethostname()}/{mp.current_process().pid}"})
+        try:
+            while True:
+                msg = recv(f)
+                if msg["op"] == "done":
+                    return
+                start = time.perf_counter()
+                ss = np.random.SeedSequence(msg["entropy"], spawn_key=tuple(msg["spawn_key"]))
+                inside, total = count_hits(np.random.default_rng(ss), msg["n"])
+                if delay:
+                    time.sleep(delay)
+                send(f, {"op": "result", "id": msg["id"], "inside": inside, "total": total,
+                         "seconds": time.perf_counter() - start})
+        except (ConnectionError, OSError):
+            # Coordinator finished (or died) while we held a duplicate batch
+            return
+
+
+def serve(coordinator, host="127.0.0.1", port=DEFAULT_PORT, ready=None):
+    """Run the coordinator until every batch has a result."""
+    with Server((host, port), Handler) as server:
+        server.coordinator = coordinator
+        if ready is not None:
+            ready(server.server_address)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        with coordinator.cond:
+            while not coordinator.done:
+                coordinator.cond.wait(0.5)
+        # Let connected workers receive their "done" before shutting down
+        time.sleep(0.2)
+        server.shutdown()
+
+
+def report(coord):
+    inside, total = coord.totals()
+    elapsed = (coord.finished or time.perf_counter()) - coord.start
+    if not total:
+        print("No trials completed")
+        return
+    p = inside / total
+    print(f"PI ≈ {4 * p:.10f} ± {4 * math.sqrt(p * (1 - p) / total):.2e} "
+          f"(error {4 * p - math.pi:+.2e})")
+    print(f"Trials: {total} in {len(coord.sizes)} batches | Time: {elapsed:.2f} s | "
+          f"Aggregate: {total / elapsed:,.0f} trials/s")
+    for name, s in sorted(coord.workers.items()):
+        rate = s["trials"] / s["busy"] if s["busy"] else 0
+        print(f"  {name:<28} batches: {s['batches']:>5} | trials: {s['trials']:>14} | {rate:,.0f} trials/s")
+
+
+def parse_args():
+    p = argparse.ArgumentParser(description="TCP cluster mode for Monte Carlo PI")
+    mode = p.add_mutually_exclusive_group(required=True)
+    mode.add_argument("--local",  type=int, metavar="N", help="Coordinator plus N local worker processes")
+    mode.add_argument("--serve",  action="store_true",    help="Run only the coordinator")
+    mode.add_argument("--worker", metavar="HOST:PORT",    help="Run one worker against a coordinator")
+    p.add_argument("--host",    default="127.0.0.1",     help="Coordinator bind address")
+    p.add_argument("--port",    type=int,   default=None,
+                   help=f"Coordinator port (default {DEFAULT_PORT}; any free port in local mode)")
+    p.add_argument("--trials",  type=float, default=1e9,  help="Total number of trials")
+    p.add_argument("--batch",   type=int,   default=BATCH, help="Trials per batch")
+    p.add_argument("--seed",    type=int,   default=None, help="Root seed")
+    p.add_argument("--timeout", type=float, default=30.0, help="Seconds before a batch may be stolen")
+    p.add_argument("--slow",    type=float, default=0.0,
+                   help="Local mode: extra seconds per batch for the first worker (straggler test)")
+    return p.parse_args()
+
+
+def main():
+    args = parse_args()
+    if args.worker:
+        host, port = args.worker.rsplit(":", 1)
+        run_worker((host, int(port)))
+        return
+
+    if args.trials < 1 or args.batch < 1:
+        raise SystemExit("--trials and --batch must be at least 1")
+    coord = Coordinator(int(args.trials), args.batch, args.seed, args.timeout)
+    if args.serve:
+        serve(coord, args.host, args.port or DEFAULT_PORT,
+              ready=lambda addr: print(f"Coordinator listening on {addr[0]}:{addr[1]}"))
+    else:
+        procs = []
+
+        def start_workers(addr):
+            for i in range(args.local):
+                delay = args.slow if i == 0 else 0.0
+                proc = mp.Process(target=run_worker, args=(addr, f"local-{i}", delay), daemon=True)
+                proc.start()
+                procs.append(proc)
+
+        serve(coord, args.host, args.port or 0, ready=start_workers)
+        for proc in procs:
+            proc.join(timeout=5)
+    report(coord)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,241 @@
+import time
+from statistics import NormalDist
+import numpy as np
+
+from mcintegrate import accumulate
+
+# Vectorized sampling engine for the Monte Carlo PI scripts
+# ---------------------------------------------------------
+# Points are drawn and classified in NumPy blocks instead of one
+# random.uniform / math.hypot call per trial.
+
+DEFAULT_BLOCK = 4096        # points per block in fixed-size mode
+MAX_BLOCK = 1 << 20         # upper bound for adaptive blocks
+
+
+def is_inside(x, y, cx, cy, radius):
+    """Vectorized circle test; same rule as hypot(x-cx, y-cy) <= radius."""
+    dx = x - cx
+    dy = y - cy
+    return dx * dx + dy * dy <= radius * radius
+
+
+class BatchSampler:
+    """Draw and classify points in the square [0, size)^2 in blocks.
+
+    Points come from a unit-square sampler (see pimonte_samplers) and are
+    scaled to the simulation square.  Without a sampler, points come from
+    one numpy.random.Generator drawn as interleaved (x, y) pairs, so the
+    point sequence does not depend on how the run is split into blocks.
+    """
+
+    def __init__(self, size, cx, cy, radius, seed=None, block=DEFAULT_BLOCK, sampler=None):
+        self.size = size
+        self.cx, self.cy = cx, cy
+        self.radius = radius
+        self.block = block
+        # The generator is only needed without a unit-square sampler
+        self.rng = np.random.default_rng(seed) if sampler is None else None
+        self.sampler = sampler
+
+    def sample(self, n):
+        """Return (xs, ys, inside) arrays for n new points."""
+        if self.sampler is not None:
+            u, v = self.sampler.draw(n)
+            xs, ys = u * self.size, v * self.size
+        else:
+            pts = self.rng.random((n, 2))
+            pts *= self.size
+            xs, ys = pts[:, 0], pts[:, 1]
+        return xs, ys, is_inside(xs, ys, self.cx, self.cy, self.radius)
+
+    def blocks(self):
+        """Yield fixed-size blocks forever."""
+        while True:
+            yield self.sample(self.block)
+
+    def sample_for(self, budget, limit=None):
+        """Yield blocks until `budget` seconds have been spent.
+
+        The block size adapts to the measured sampling rate so that one
+        frame gets as many points as fit into its time budget.  `limit`
+        caps the total number of points yielded.
+        """
+        deadline = time.perf_counter() + budget
+        n = self.block
+        drawn = 0
+        while True:
+            if limit is not None:
+                n = min(n, limit - drawn)
+                if n <= 0:
+                    return
+            start = time.perf_counter()
+            batch = self.sample(n)
+            drawn += n
+            yield batch
+            now = time.perf_counter()
+            left = deadline - now
+            if left <= 0:
+                return
+            # Aim the next block at the remaining budget
+            rate = n / max(now - start, 1e-9)
+            n = int(min(MAX_BLOCK, max(self.block, rate * left)))
+
+
+def quarter_disc(pts):
+    """Indicator of the unit quarter disc for an (m, 2) array of points."""
+    return is_inside(pts[:, 0], pts[:, 1], 0.0, 0.0, 1.0)
+
+
+def count_hits(rng, n, block=MAX_BLOCK):
+    """Count quarter-disc hits for n unit-square samples drawn from rng.
+
+    Only the (inside, total) counts are kept, so memory is bounded by
+    `block` no matter how large n is.
+    """
+    acc = accumulate(quarter_disc, (0.0, 0.0), (1.0, 1.0), n, rng, block)
+    return acc.hits, n          # exact integer count, not the float mean * n
+
+
+class ConvergenceSeries:
+    """Bounded-memory record of a convergence curve.
+
+    The x-axis [0, span] is split into a fixed number of columns (one per
+    graph pixel) and each column keeps only the min, max and last value
+    that landed in it.  When a trial count beyond `span` arrives, the span
+    doubles and neighbouring columns are merged pairwise, so memory and
+    drawing cost stay constant however long the run is.
+    """
+
+    def __init__(self, columns, span):
+        if columns % 2:
+            raise ValueError("columns must be even")
+        self.columns = columns
+        self.span = span
+        self.lo = np.full(columns, np.nan)
+        self.hi = np.full(columns, np.nan)
+        self.last = np.full(columns, np.nan)
+        self.last_x = np.zeros(columns, dtype=np.int64)
+        self.rescaled = 0       # bumped every time the span doubles
+        self.dirty = None       # (first, last) column touched since clear_dirty()
+        self.redraw = False     # span changed since clear_dirty(): redraw all columns
+
+    def _grow(self):
+        half = self.columns // 2
+        for arr, merge in ((self.lo, np.fmin), (self.hi, np.fmax)):
+            arr[:half] = merge(arr[0::2], arr[1::2])
+            arr[half:] = np.nan
+        pairs_last = self.last.reshape(half, 2)
+        pairs_x = self.last_x.reshape(half, 2)
+        second = ~np.isnan(pairs_last[:, 1])
+        self.last[:half] = np.where(second, pairs_last[:, 1], pairs_last[:, 0])
+        self.last_x[:half] = np.where(second, pairs_x[:, 1], pairs_x[:, 0])
+        self.last[half:] = np.nan
+        self.last_x[half:] = 0
+        self.span *= 2
+        self.rescaled += 1
+        self.redraw = True
+        self.dirty = (0, self.columns - 1)
+
+    def _columns_for(self, xs):
+        cols = (xs * self.columns) // self.span
+        return np.minimum(cols, self.columns - 1)
+
+    def add(self, x, value):
+        """Record one (trials, estimate) pair."""
+        self.add_many(np.array([x]), np.array([value]))
+
+    def add_many(self, xs, values):
+        """Record a block of (trials, estimate) pairs with increasing trials."""
+        if len(xs) == 0:
+            return
+        xs = np.asarray(xs, dtype=np.int64)
+        values = np.asarray(values, dtype=float)
+        while xs[-1] > self.span:
+            self._grow()
+        cols = self._columns_for(xs)
+        np.fmin.at(self.lo, cols, values)
+        np.fmax.at(self.hi, cols, values)
+        # cols is non-decreasing: the last sample of each run wins
+        ends = np.flatnonzero(np.diff(cols, append=cols[-1] + 1))
+        self.last[cols[ends]] = values[ends]
+        self.last_x[cols[ends]] = xs[ends]
+        first, last = int(cols[0]), int(cols[-1])
+        if self.dirty is not None:
+            first, last = min(first, self.dirty[0]), max(last, self.dirty[1])
+        self.dirty = (first, last)
+
+    def clear_dirty(self):
+        self.dirty = None
+        self.redraw = False
+
+    def get_state(self):
+        """Plain arrays and numbers describing the series (for checkpoints)."""
+        return {"columns": self.columns, "span": self.span, "rescaled": self.rescaled,
+                "lo": self.lo, "hi": self.hi, "last": self.last, "last_x": self.last_x}
+
+    @classmethod
+    def from_state(cls, state):
+        series = cls(int(state["columns"]), int(state["span"]))
+        series.rescaled = int(state["rescaled"])
+        for name in ("lo", "hi", "last", "last_x"):
+            getattr(series, name)[:] = state[name]
+        # Everything needs drawing on a fresh screen
+        series.redraw = True
+        series.dirty = (0, series.columns - 1)
+        return series
+
+    def arrays(self):
+        """Return (trials, last, lo, hi) for the filled columns."""
+        filled = ~np.isnan(self.last)
+        return self.last_x[filled], self.last[filled], self.lo[filled], self.hi[filled]
+
+
+def wilson_interval(inside, total, z):
+    """Wilson score interval for the hit ratio inside/total (array-friendly)."""
+    inside = np.asarray(inside, dtype=float)
+    total = np.asarray(total, dtype=float)
+    p = inside / total
+    z2 = z * z
+    denom = 1 + z2 / total
+    centre = (p + z2 / (2 * total)) / denom
+    half = z * np.sqrt(p * (1 - p) / total + z2 / (4 * total * total)) / denom
+    return centre - half, centre + half
+
+
+class ConfidenceStop:
+    """Streaming stopping rule: stop once the PI confidence interval is narrow.
+
+    Counts are updated incrementally and the Wilson interval of the hit ratio
+    is scaled by `factor` (PI = factor * inside / total).  The run is done once
+    the interval half-width is at most `target` at the requested confidence.
+    For QMC and stratified samplers the Bernoulli variance is conservative.
+    """
+
+    def __init__(self, target, confidence=0.95, factor=4.0, min_trials=1000):
+        self.target = target
+        self.confidence = confidence
+        self.z = NormalDist().inv_cdf(0.5 + confidence / 2)
+        self.factor = factor
+        self.min_trials = min_trials
+        self.inside = self.total = 0
+
+    def update(self, inside, total):
+        self.inside += inside
+        self.total += total
+
+    def interval(self):
+        """Current (low, high) confidence bounds on PI."""
+        if not self.total:
+            return 0.0, self.factor
+        lo, hi = wilson_interval(self.inside, self.total, self.z)
+        return float(lo) * self.factor, float(hi) * self.factor
+
+    def half_width(self):
+        lo, hi = self.interval()
+        return (hi - lo) / 2
+
+    @property
+    def done(self):
+        return (self.target > 0 and self.total >= self.min_trials
+                and self.half_width() <= self.target)
@@ -10,8 +10,15 @@ def monte_carlo_pi(n):
     pi_estimate = 4 * np.sum(inside_circle) / n
     return pi_estimate, x, y, inside_circle
 
-# Function to animate the Monte Carlo simulation
-def animate_monte_carlo(n_points=1000, interval=10):
+# Streaming settings
+MAX_FRAMES = 2000            # frames per animation; points are grouped into chunks
+DENSITY_THRESHOLD = 200000   # above this many points, switch scatter -> density image
+DENSITY_BINS = 300           # histogram resolution of the density image
+
+# Build the figure and the per-frame update function.  Returns
+# (fig, update, frames); update(i) must be called for i = 0, 1, 2, ... in order.
+def build_animation(n_points=1000, chunk=None, density_threshold=DENSITY_THRESHOLD,
+                    bins=DENSITY_BINS, seed=None):
     fig, ax = plt.subplots(figsize=(6,6))
     ax.set_xlim(0, 1)
     ax.set_ylim(0, 1)
@@ -26,35 +33,92 @@ def animate_monte_carlo(n_points=1000, interval=10):
     # Create empty scatter plots for points inside and outside the circle
     scatter_inside = ax.scatter([], [], color='blue', s=1, label='Inside')
     scatter_outside = ax.scatter([], [], color='red', s=1, label='Outside')
+    # Hit-count image used once there are too many points for a scatter
+    density = ax.imshow(np.ones((bins, bins, 3)), extent=(0, 1, 0, 1), origin='lower',
+                        interpolation='nearest', visible=False, zorder=0)
     
     # Text to display current pi estimate
     pi_text = ax.text(0.02, 0.80, '', transform=ax.transAxes)
     
-    # Generate all random points in advance
-    x = np.random.uniform(0, 1, n_points)
-    y = np.random.uniform(0, 1, n_points)
-    inside_circle = (x**2 + y**2) <= 1
+    # Points are generated chunk by chunk; the scatter offsets live in
+    # preallocated buffers so each frame only writes the new points.
+    chunk = chunk or max(1, -(-n_points // MAX_FRAMES))
+    frames = -(-n_points // chunk)
+    rng = np.random.default_rng(seed)
+    capacity = min(n_points, density_threshold)
+    buf_inside = np.empty((capacity, 2))
+    buf_outside = np.empty((capacity, 2))
+    hist_inside = np.zeros(bins * bins)
+    hist_outside = np.zeros(bins * bins)
+    img = np.ones((bins, bins, 3))
+    state = {'total': 0, 'inside': 0, 'n_in': 0, 'n_out': 0, 'dense': False}
+    
+    def add_to_histograms(pts, hist):
+        # Row-major (y, x) bin index, counted with a single bincount
+        cells = np.minimum((pts * bins).astype(np.intp), bins - 1)
+        hist += np.bincount(cells[:, 1] * bins + cells[:, 0], minlength=bins * bins)
+    
+    def switch_to_density():
+        add_to_histograms(buf_inside[:state['n_in']], hist_inside)
+        add_to_histograms(buf_outside[:state['n_out']], hist_outside)
+        scatter_inside.set_visible(False)
+        scatter_outside.set_visible(False)
+        density.set_visible(True)
+        state['dense'] = True
     
     def update(frame):
-        # Update points displayed based on current frame
-        current_x_inside = x[:frame][inside_circle[:frame]]
-        current_y_inside = y[:frame][inside_circle[:frame]]
-        current_x_outside = x[:frame][~inside_circle[:frame]]
-        current_y_outside = y[:frame][~inside_circle[:frame]]
+        # Generate and classify only this frame's chunk
+        m = min(chunk, n_points - state['total'])
+        pts = rng.uniform(0, 1, (m, 2))
+        inside_circle = (pts[:, 0]**2 + pts[:, 1]**2) <= 1
+        state['total'] += m
+        state['inside'] += int(inside_circle.sum())
         
-        scatter_inside.set_offsets(np.c_[current_x_inside, current_y_inside])
-        scatter_outside.set_offsets(np.c_[current_x_outside, current_y_outside])
+        if not state['dense'] and state['total'] > density_threshold:
+            switch_to_density()
+        if state['dense']:
+            add_to_histograms(pts[inside_circle], hist_inside)
+            add_to_histograms(pts[~inside_circle], hist_outside)
+            # Blend blue (inside) and red (outside) hit densities onto white
+            peak = max(hist_inside.max(), hist_outside.max(), 1)
+            d_in = (hist_inside / peak).reshape(bins, bins)
+            d_out = (hist_outside / peak).reshape(bins, bins)
+            np.subtract(1, d_in, out=img[..., 0])
+            np.subtract(img[..., 0], d_out, out=img[..., 1])
+            np.maximum(img[..., 1], 0, out=img[..., 1])   # bins on the arc mix both
+            np.subtract(1, d_out, out=img[..., 2])
+            density.set_data(img)
+        else:
+            for buf, key, new, artist in ((buf_inside, 'n_in', pts[inside_circle], scatter_inside),
+                                          (buf_outside, 'n_out', pts[~inside_circle], scatter_outside)):
+                k = state[key]
+                buf[k:k+len(new)] = new
+                state[key] = k + len(new)
+                artist.set_offsets(buf[:state[key]])
         
         # Update pi estimate text
-        if frame > 0:
-            current_pi = 4 * np.sum(inside_circle[:frame]) / frame
-            pi_text.set_text(f'Points: {frame}\nπ estimate: {current_pi:.6f}')
+        current_pi = 4 * state['inside'] / state['total']
+        pi_text.set_text(f'Points: {state["total"]}\nπ estimate: {current_pi:.6f}')
         
-        return scatter_inside, scatter_outside, pi_text
+        return scatter_inside, scatter_outside, density, pi_text
     
-    ax.legend()
-    ani = animation.FuncAnimation(fig, update, frames=n_points, interval=interval, blit=True, repeat=False)
+    # Fixed legend position: 'best' would scan every scatter offset on redraw
+    ax.legend(loc='upper right')
+    return fig, update, frames
+
+# Function to animate the Monte Carlo simulation
+def animate_monte_carlo(n_points=1000, interval=10, chunk=None,
+                        density_threshold=DENSITY_THRESHOLD, bins=DENSITY_BINS, seed=None):
+    fig, update, frames = build_animation(n_points, chunk, density_threshold, bins, seed)
+    # update() consumes a chunk per call, so the initial draw must not call it
+    ani = animation.FuncAnimation(fig, update, frames=frames, init_func=lambda: (),
+                                  interval=interval, blit=True, repeat=False)
     plt.show()
     
-# Run the animation with 2000 points, updating every 20ms
-animate_monte_carlo(2000, 20)
\ No newline at end of file
+if __name__ == "__main__":
+    # Run the animation with 2000 points, updating every 20ms
+    animate_monte_carlo(2000, 20)
+    # Streaming example: 10 million points, density image after 200k
+    # animate_monte_carlo(10_000_000, 20)
+    # Offscreen export (no display needed): see animexport.py
+    # python animexport.py pimonte --points 100000 --out pimonte.mp4
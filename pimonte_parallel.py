@@ -0,0 +1,83 @@
+import argparse
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from pimonte_engine import count_hits, MAX_BLOCK
+
+# Headless multi-core Monte Carlo PI estimator
+# --------------------------------------------
+# The trial budget is split into tasks; every task gets its own
+# SeedSequence-spawned PCG64 stream and only returns (inside, total).
+
+# python pimonte_parallel.py --trials 1e10 --workers 8 --seed 42
+
+
+def run_task(seed_seq, n, block):
+    """Worker entry point: count hits for n trials on an independent stream."""
+    rng = np.random.Generator(np.random.PCG64(seed_seq))
+    return count_hits(rng, n, block)
+
+
+def split_trials(trials, tasks):
+    """Split `trials` into `tasks` near-equal integer parts."""
+    base, extra = divmod(trials, tasks)
+    return [base + (i < extra) for i in range(tasks)]
+
+
+def estimate_pi(trials, workers=None, seed=None, tasks=None, block=MAX_BLOCK):
+    """Run `trials` samples across a process pool.
+
+    Returns (pi_estimate, inside, total, seconds).
+    """
+    if trials < 1:
+        raise ValueError("trials must be at least 1")
+    workers = workers or os.cpu_count() or 1
+    # A few tasks per worker keeps the pool busy if one core is slower
+    tasks = tasks or workers * 4
+    tasks = max(1, min(tasks, trials))
+    streams = np.random.SeedSequence(seed).spawn(tasks)
+    sizes = split_trials(trials, tasks)
+
+    start = time.perf_counter()
+    inside = total = 0
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(run_task, ss, n, block) for ss, n in zip(streams, sizes)]
+        for fut in futures:
+            i, t = fut.result()
+            inside += i
+            total += t
+    elapsed = time.perf_counter() - start
+    return 4 * inside / total, inside, total, elapsed
+
+
+def parse_args():
+    p = argparse.ArgumentParser(description="Parallel headless Monte Carlo PI estimator")
+    p.add_argument("--trials",  type=float, default=1e9,  help="Total number of trials (e.g. 1e10)")
+    p.add_argument("--workers", type=int,   default=None, help="Worker processes (default: all cores)")
+    p.add_argument("--tasks",   type=int,   default=None, help="Number of tasks/streams (default: 4 per worker)")
+    p.add_argument("--seed",    type=int,   default=None, help="Root seed for SeedSequence")
+    p.add_argument("--block",   type=int,   default=MAX_BLOCK, help="Samples per vectorized block")
+    args = p.parse_args()
+    if int(args.trials) < 1:
+        p.error("--trials must be at least 1")
+    return args
+
+
+def main():
+    args = parse_args()
+    trials = int(args.trials)
+    pi_est, inside, total, elapsed = estimate_pi(
+        trials, args.workers, args.seed, args.tasks, args.block)
+    p = inside / total
+    stderr = 4 * math.sqrt(p * (1 - p) / total)
+    print(f"PI ≈ {pi_est:.10f} ± {stderr:.2e} (error {pi_est - math.pi:+.2e})")
+    print(f"Trials: {total} | Inside: {inside}")
+    print(f"Time: {elapsed:.2f} s | Throughput: {total / elapsed:,.0f} trials/s")
+
+
+if __name__ == "__main__":
+    main()
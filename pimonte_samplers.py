@@ -0,0 +1,312 @@
+import argparse
+import math
+import time
+import numpy as np
+
+from pimonte_engine import is_inside
+
+# Pluggable point samplers for Monte Carlo PI
+# -------------------------------------------
+# Every sampler yields points in the unit square [0, 1)^2 via draw(n) and
+# estimates PI from the quarter disc u^2 + v^2 <= 1 via estimate(n), which
+# returns (pi_estimate, standard_error).  Low-discrepancy and stratified
+# samplers are randomized so that independent replicates give an honest
+# standard error.
+
+# python pimonte_samplers.py --target 1e-6 --budget 30
+
+DEFAULT_REPLICATES = 16
+BLOCK = 1 << 20             # points per block, bounds memory in estimate()
+
+
+def quarter_disc_hits(u, v):
+    return is_inside(u, v, 0.0, 0.0, 1.0)
+
+
+def count_quarter_disc(sampler, n):
+    """Draw n points from sampler in blocks and count quarter-disc hits."""
+    inside = 0
+    left = n
+    while left > 0:
+        u, v = sampler.draw(min(BLOCK, left))
+        inside += int(np.count_nonzero(quarter_disc_hits(u, v)))
+        left -= len(u)
+    return inside
+
+
+class Sampler:
+    """Base class: sequential draw(n) plus a replicate-based estimate()."""
+
+    name = "base"
+
+    def __init__(self, seed=None):
+        if not isinstance(seed, np.random.SeedSequence):
+            seed = np.random.SeedSequence(seed)
+        self.seed_seq = seed
+        self.rng = np.random.default_rng(self.seed_seq)
+
+    def draw(self, n):
+        """Return the next n points as (u, v) arrays."""
+        raise NotImplementedError
+
+    def get_state(self):
+        """JSON-friendly state; set_state() on a fresh sampler of the same
+        type continues the exact same point stream."""
+        return {"rng": self.rng.bit_generator.state}
+
+    def set_state(self, state):
+        self.rng.bit_generator.state = state["rng"]
+
+    def replicate_size(self, n):
+        """Largest replicate size <= n that suits this sampler."""
+        return n
+
+    def replicate(self, seed_seq, n):
+        """Return an independent randomized copy for an n-point replicate."""
+        return type(self)(seed_seq)
+
+    def estimate(self, n, replicates=DEFAULT_REPLICATES):
+        """Estimate PI from n points split over independent replicates."""
+        m = self.replicate_size(max(1, n // replicates))
+        ests = np.empty(replicates)
+        for r, ss in enumerate(self.seed_seq.spawn(replicates)):
+            ests[r] = 4 * count_quarter_disc(self.replicate(ss, m), m) / m
+        return float(ests.mean()), float(ests.std(ddof=1)) / math.sqrt(replicates)
+
+
+class RandomSampler(Sampler):
+    """Plain pseudo-random points (the random.uniform baseline)."""
+
+    name = "random"
+
+    def draw(self, n):
+        pts = self.rng.random((n, 2))
+        return pts[:, 0], pts[:, 1]
+
+    def estimate(self, n, replicates=None):
+        p = count_quarter_disc(self, n) / n
+        return 4 * p, 4 * math.sqrt(p * (1 - p) / n)
+
+
+class AntitheticSampler(RandomSampler):
+    """Pairs (u, v) with (1-u, 1-v); the hit indicator is monotone, so the
+    two halves of each pair are negatively correlated."""
+
+    name = "antithetic"
+
+    def __init__(self, seed=None):
+        super().__init__(seed)
+        self._pending = np.empty((0, 2))   # second half of a split pair
+
+    def draw(self, n):
+        half = (n - len(self._pending) + 1) // 2
+        pts = self.rng.random((half, 2))
+        both = np.empty((2 * half, 2))
+        both[0::2] = pts
+        both[1::2] = 1 - pts
+        both = np.concatenate([self._pending, both])
+        self._pending = both[n:]
+        return both[:n, 0], both[:n, 1]
+
+    def get_state(self):
+        return {**super().get_state(), "pending": self._pending.tolist()}
+
+    def set_state(self, state):
+        super().set_state(state)
+        self._pending = np.array(state["pending"], dtype=float).reshape(-1, 2)
+
+    def estimate(self, n, replicates=None):
+        # Each pair scores h = 2 * (hit + anti-hit) in {0, 2, 4}, i.e. 4 times
+        # the pair average; mean and variance come from the counts of each value.
+        pairs = max(2, n // 2)
+        counts = np.zeros(3, dtype=np.int64)
+        left = pairs
+        while left > 0:
+            pts = self.rng.random((min(BLOCK, left), 2))
+            both = (quarter_disc_hits(pts[:, 0], pts[:, 1]).astype(np.int64)
+                    + quarter_disc_hits(1 - pts[:, 0], 1 - pts[:, 1]))
+            counts += np.bincount(both, minlength=3)
+            left -= len(pts)
+        h = np.array([0.0, 2.0, 4.0])
+        mean = float(counts @ h) / pairs
+        var = (counts @ (h - mean) ** 2) / (pairs - 1)
+        return mean, math.sqrt(var / pairs)
+
+
+class StratifiedSampler(Sampler):
+    """Jittered grid: one uniform point in each cell of a k x k grid."""
+
+    name = "stratified"
+
+    def __init__(self, seed=None, strata=64):
+        super().__init__(seed)
+        self.strata = strata
+        self._pending = np.empty((0, 2))
+
+    def replicate_size(self, n):
+        return max(1, math.isqrt(n)) ** 2
+
+    def replicate(self, seed_seq, n):
+        return type(self)(seed_seq, strata=math.isqrt(n))
+
+    def get_state(self):
+        return {**super().get_state(), "strata": self.strata, "pending": self._pending.tolist()}
+
+    def set_state(self, state):
+        super().set_state(state)
+        self.strata = state["strata"]
+        self._pending = np.array(state["pending"], dtype=float).reshape(-1, 2)
+
+    def _sweep(self):
+        k = self.strata
+        cells = np.stack(np.divmod(self.rng.permutation(k * k), k), axis=1)
+        return (cells + self.rng.random((k * k, 2))) / k
+
+    def draw(self, n):
+        # Whole sweeps cover the square evenly; leftovers carry over
+        parts = [self._pending]
+        have = len(self._pending)
+        while have < n:
+            sweep = self._sweep()
+            parts.append(sweep)
+            have += len(sweep)
+        pts = np.concatenate(parts)
+        self._pending = pts[n:]
+        return pts[:n, 0], pts[:n, 1]
+
+
+class HaltonSampler(Sampler):
+    """Halton sequence in bases (2, 3) with a random Cranley-Patterson shift."""
+
+    name = "halton"
+    bases = (2, 3)
+
+    def __init__(self, seed=None):
+        super().__init__(seed)
+        self.index = 0
+        self.shift = self.rng.random(2)
+
+    def get_state(self):
+        return {**super().get_state(), "index": self.index, "shift": self.shift.tolist()}
+
+    def set_state(self, state):
+        super().set_state(state)
+        self.index = state["index"]
+        self.shift = np.array(state["shift"])
+
+    @staticmethod
+    def radical_inverse(idx, base):
+        idx = idx.copy()
+        out = np.zeros(len(idx))
+        scale = 1.0 / base
+        while np.any(idx):
+            idx, digit = np.divmod(idx, base)
+            out += digit * scale
+            scale /= base
+        return out
+
+    def draw(self, n):
+        idx = np.arange(self.index, self.index + n, dtype=np.int64)
+        self.index += n
+        u = (self.radical_inverse(idx, self.bases[0]) + self.shift[0]) % 1.0
+        v = (self.radical_inverse(idx, self.bases[1]) + self.shift[1]) % 1.0
+        return u, v
+
+
+def _sobol_directions(bits=32):
+    # Dimension 1: van der Corput; dimension 2: primitive polynomial x + 1,
+    # whose direction numbers follow v_k = v_{k-1} ^ (v_{k-1} >> 1).
+    top = np.uint64(1 << (bits - 1))
+    v1 = np.array([top >> np.uint64(k) for k in range(bits)], dtype=np.uint64)
+    v2 = np.empty(bits, dtype=np.uint64)
+    v2[0] = top
+    for k in range(1, bits):
+        v2[k] = v2[k - 1] ^ (v2[k - 1] >> np.uint64(1))
+    return v1, v2
+
+
+class SobolSampler(Sampler):
+    """2D Sobol sequence (gray-code order) with a random digital shift."""
+
+    name = "sobol"
+    bits = 32
+    directions = _sobol_directions(bits)
+
+    def __init__(self, seed=None):
+        super().__init__(seed)
+        self.index = 0
+        self.shift = self.rng.integers(0, 1 << self.bits, size=2, dtype=np.uint64)
+
+    def get_state(self):
+        return {**super().get_state(), "index": self.index, "shift": [int(s) for s in self.shift]}
+
+    def set_state(self, state):
+        super().set_state(state)
+        self.index = state["index"]
+        self.shift = np.array(state["shift"], dtype=np.uint64)
+
+    def replicate_size(self, n):
+        # Sobol points are balanced over power-of-two blocks
+        return 1 << (n.bit_length() - 1)
+
+    def draw(self, n):
+        idx = np.arange(self.index, self.index + n, dtype=np.uint64)
+        self.index += n
+        gray = idx ^ (idx >> np.uint64(1))
+        xs = [np.full(n, s, dtype=np.uint64) for s in self.shift]
+        # A block can skip a bit and still use higher ones (e.g. indices 3, 4)
+        for k in range(int(gray.max()).bit_length() if n else 0):
+            bit = ((gray >> np.uint64(k)) & np.uint64(1)).astype(bool)
+            if not bit.any():
+                continue
+            for x, v in zip(xs, self.directions):
+                x[bit] ^= v[k]
+        scale = 1.0 / (1 << self.bits)
+        return xs[0] * scale, xs[1] * scale
+
+
+SAMPLERS = {cls.name: cls for cls in (
+    RandomSampler, AntitheticSampler, StratifiedSampler, HaltonSampler, SobolSampler)}
+
+
+def make_sampler(name, seed=None):
+    """Look up a sampler by name ("random", "sobol", ...)."""
+    try:
+        return SAMPLERS[name](seed)
+    except KeyError:
+        raise ValueError(f"unknown sampler {name!r}; choose from {', '.join(SAMPLERS)}") from None
+
+
+def time_to_accuracy(name, target, budget, seed=None, start=1 << 12):
+    """Double the sample count until the standard error reaches `target`
+    or `budget` seconds are used. Returns (n, pi, stderr, seconds)."""
+    n = start
+    t0 = time.perf_counter()
+    while True:
+        pi_est, se = make_sampler(name, seed).estimate(n)
+        elapsed = time.perf_counter() - t0
+        if se <= target or elapsed * 3 > budget:
+            return n, pi_est, se, elapsed
+        n *= 2
+
+
+def parse_args():
+    p = argparse.ArgumentParser(description="Compare Monte Carlo PI samplers by time to accuracy")
+    p.add_argument("--target",   type=float, default=1e-6, help="Target standard error")
+    p.add_argument("--budget",   type=float, default=30,   help="Time budget per sampler in seconds")
+    p.add_argument("--seed",     type=int,   default=None, help="Root seed")
+    p.add_argument("--samplers", nargs="+",  default=list(SAMPLERS), choices=list(SAMPLERS))
+    return p.parse_args()
+
+
+def main():
+    args = parse_args()
+    print(f"{'sampler':<12}{'samples':>14}{'PI estimate':>16}{'std err':>11}{'error':>11}{'time s':>9}  reached")
+    for name in args.samplers:
+        n, pi_est, se, elapsed = time_to_accuracy(name, args.target, args.budget, args.seed)
+        print(f"{name:<12}{n:>14}{pi_est:>16.10f}{se:>11.2e}{abs(pi_est - math.pi):>11.2e}"
+              f"{elapsed:>9.2f}  {'yes' if se <= args.target else 'no'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -20,50 +20,59 @@ def newton_raphson(x0, tol=1e-10, max_iter=10):
         x0 = x1
     return xs
 
-# Initial guess and run Newton-Raphson
-x0 = 3.0
-xs = newton_raphson(x0, max_iter=8)
+# Build the figure and frame function; returns (fig, animate, frames).
+# animate(i) must be called in order (frame 0 resets).
+def build_animation(x0=3.0, max_iter=8):
+    # Initial guess and run Newton-Raphson
+    xs = newton_raphson(x0, max_iter=max_iter)
 
-# Prepare for animation
-x_vals = np.linspace(2.5, 4.5, 400)
-y_vals = f(x_vals)
+    # Prepare for animation
+    x_vals = np.linspace(2.5, 4.5, 400)
+    y_vals = f(x_vals)
 
-fig, ax = plt.subplots(figsize=(8, 5))
-ax.plot(x_vals, y_vals, label='f(x) = tan(x/4) - 1')
-ax.axhline(0, color='gray', lw=1)
-ax.set_ylim(-2, 2)
-ax.set_xlabel('x')
-ax.set_ylabel('f(x)')
-ax.set_title("Newton's Method to Approximate π")
+    fig, ax = plt.subplots(figsize=(8, 5))
+    ax.plot(x_vals, y_vals, label='f(x) = tan(x/4) - 1')
+    ax.axhline(0, color='gray', lw=1)
+    ax.set_ylim(-2, 2)
+    ax.set_xlabel('x')
+    ax.set_ylabel('f(x)')
+    ax.set_title("Newton's Method to Approximate π")
 
-point, = ax.plot([], [], 'ro', label='Current Estimate')
-lines = []
+    point, = ax.plot([], [], 'ro', label='Current Estimate')
+    lines = []
 
-def init():
-    point.set_data([], [])
-    for line in lines:
-        line.remove()
-    lines.clear()
-    return [point]
+    def init():
+        point.set_data([], [])
+        for line in lines:
+            line.remove()
+        lines.clear()
+        return [point]
 
-def animate(i):
-    if i == 0:
-        return init()
-    x_curr = xs[i-1]
-    y_curr = f(x_curr)
-    point.set_data([x_curr], [y_curr])
-    # Draw tangent line
-    slope = df(x_curr)
-    x_tan = np.linspace(x_curr-0.5, x_curr+0.5, 10)
-    y_tan = slope * (x_tan - x_curr) + y_curr
-    line, = ax.plot(x_tan, y_tan, 'g--', alpha=0.5)
-    lines.append(line)
-    return [point, line]
+    def animate(i):
+        if i == 0:
+            return init()
+        x_curr = xs[i-1]
+        y_curr = f(x_curr)
+        point.set_data([x_curr], [y_curr])
+        # Draw tangent line
+        slope = df(x_curr)
+        x_tan = np.linspace(x_curr-0.5, x_curr+0.5, 10)
+        y_tan = slope * (x_tan - x_curr) + y_curr
+        line, = ax.plot(x_tan, y_tan, 'g--', alpha=0.5)
+        lines.append(line)
+        return [point, line]
 
-ani = animation.FuncAnimation(fig, animate, frames=len(xs), init_func=init, blit=True, repeat=False, interval=1200)
+    # Show legend and π value
+    ax.legend(loc='upper left', bbox_to_anchor=(1, 1))
+    fig.text(0.5, 0.95, f"Final π estimate: {xs[-1]:.10f}", ha='center', va='top', fontsize=12)
+    fig.tight_layout(rect=[0, 0, 0.85, 0.92])
+    return fig, animate, len(xs)
 
-# Show legend and π value
-ax.legend(loc='upper left', bbox_to_anchor=(1, 1))
-fig.text(0.5, 0.95, f"Final π estimate: {xs[-1]:.10f}", ha='center', va='top', fontsize=12)
-plt.tight_layout(rect=[0, 0, 0.85, 0.92])
-plt.show()
+def main():
+    fig, animate, frames = build_animation()
+    ani = animation.FuncAnimation(fig, animate, frames=frames, init_func=lambda: animate(0),
+                                  blit=True, repeat=False, interval=1200)
+    plt.show()
+
+if __name__ == "__main__":
+    main()
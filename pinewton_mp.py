@@ -0,0 +1,188 @@
+import argparse
+import math
+import time
+from decimal import Decimal, localcontext
+
+from pinewton import newton_raphson
+
+try:
+    import mpmath
+except ImportError:          # optional; the decimal backend needs nothing extra
+    mpmath = None
+
+# Arbitrary-precision Newton for PI with precision doubling
+# ---------------------------------------------------------
+# Same iteration as pinewton.py -- Newton on f(x) = tan(x/4) - 1 -- but
+# past float64.  With f'(x) = 1 / (4 cos^2(x/4)) the step is
+#
+#     x <- x - 4 cos(x/4) (sin(x/4) - cos(x/4))
+#
+# Newton doubles the number of correct digits per step, so iteration k only
+# needs about twice the precision of iteration k-1: the early steps are
+# cheap and only the last one runs at the full target precision.
+#
+# The decimal backend evaluates sin/cos by argument halving (Taylor series
+# on x / 2^m, then m double-angle steps); mpmath is used instead if present.
+
+# python pinewton_mp.py --digits 100000
+# python pinewton_mp.py --digits 20000 --backend decimal --check
+
+GUARD = 10           # extra working digits per iteration
+FLOAT_DIGITS = 15    # what the float64 starting iterate is good for
+
+
+def precision_schedule(digits, start=FLOAT_DIGITS):
+    """Working precisions, doubling from `start` up to `digits` (+ guard)."""
+    schedule = []
+    p = digits
+    while p > start:
+        schedule.append(p + GUARD)
+        p = (p + 1) // 2
+    return schedule[::-1]
+
+
+def halvings(prec):
+    # Balances Taylor terms (~prec / (0.6 m)) against m double-angle steps
+    return max(4, int(math.sqrt(prec / 0.6)))
+
+
+def decimal_sincos(x, prec):
+    """(sin x, cos x) to about `prec` digits for 0 < x < PI/2."""
+    m = halvings(prec)
+    with localcontext() as ctx:
+        # Each double-angle step can lose a little, so carry some extra digits
+        ctx.prec = prec + m // 3 + GUARD
+        y = x / (1 << m)
+        eps = Decimal(10) ** -(ctx.prec + 2)
+        # Taylor terms y^k / k! go alternately to sin y and to 1 - cos y
+        sin, vers = y, Decimal(0)
+        term, k = y, 1
+        while term > eps:
+            k += 1
+            term = term * y / k
+            sign = 1 if k % 4 in (1, 2) else -1
+            if k % 2:
+                sin += sign * term
+            else:
+                vers += sign * term
+        # sin 2y = 2 sin y (1 - vers y); vers 2y = 2 sin^2 y
+        for _ in range(m):
+            sin, vers = 2 * sin * (1 - vers), 2 * sin * sin
+        cos = 1 - vers
+    return +sin, +cos
+
+
+class DecimalBackend:
+    name = "decimal"
+
+    def convert(self, x):
+        return Decimal(repr(x)) if isinstance(x, float) else Decimal(x)
+
+    def step(self, x, prec):
+        with localcontext() as ctx:
+            ctx.prec = prec
+            x = +x
+            s, c = decimal_sincos(x / 4, prec)
+            return x - 4 * c * (s - c)
+
+    def to_str(self, x, digits):
+        return str(x)[:digits + 2]
+
+
+class MpmathBackend:
+    name = "mpmath"
+
+    def convert(self, x):
+        return mpmath.mpf(x)
+
+    def step(self, x, prec):
+        with mpmath.workdps(prec):
+            x = +x
+            s, c = mpmath.sin(x / 4), mpmath.cos(x / 4)
+            return x - 4 * c * (s - c)
+
+    def to_str(self, x, digits):
+        with mpmath.workdps(digits + 10):
+            return mpmath.nstr(x, digits + 5, strip_zeros=False)[:digits + 2]
+
+
+def make_backend(name="auto"):
+    if name == "auto":
+        name = "mpmath" if mpmath is not None else "decimal"
+    if name == "mpmath":
+        if mpmath is None:
+            raise ImportError("the mpmath backend needs `pip install mpmath`")
+        return MpmathBackend()
+    return DecimalBackend()
+
+
+def newton_pi(digits, backend="auto", x0=3.0):
+    """PI to `digits` decimals by precision-doubling Newton.
+
+    Returns (digit string "3.14...", per-iteration log) where each log entry
+    is (precision, seconds, iterate).
+    """
+    be = make_backend(backend) if isinstance(backend, str) else backend
+    x = be.convert(float(newton_raphson(x0, max_iter=8)[-1]))
+    log = []
+    for prec in precision_schedule(digits):
+        start = time.perf_counter()
+        x = be.step(x, prec)
+        log.append((prec, time.perf_counter() - start, x))
+    return be.to_str(x, digits), log
+
+
+def agreeing_digits(a, b):
+    """Number of matching decimals between two digit strings "3.xxx"."""
+    n = 0
+    for ca, cb in zip(a[2:], b[2:]):
+        if ca != cb:
+            break
+        n += 1
+    return n
+
+
+def machin_digits(digits):
+    """Independent reference: Machin's formula in integer fixed point."""
+    from pileague import arctan_inv
+    one = 10 ** (digits + GUARD)
+    terms = int(digits / math.log10(25)) + 2
+    value = 16 * arctan_inv(5, one, terms) - 4 * arctan_inv(239, one, terms // 3 + 2)
+    s = str(Decimal(value))      # int -> str is capped at 4300 digits
+    return f"{s[0]}.{s[1:digits + 1]}"
+
+
+def parse_args():
+    p = argparse.ArgumentParser(description="PI by precision-doubling arbitrary-precision Newton")
+    p.add_argument("--digits",  type=int, default=10000, help="Decimal digits of PI")
+    p.add_argument("--backend", default="auto", choices=["auto", "decimal", "mpmath"],
+                   help="Arithmetic backend (auto: mpmath if installed)")
+    p.add_argument("--check",   action="store_true", help="Verify against Machin's formula")
+    p.add_argument("--print",   action="store_true", help="Print all digits")
+    return p.parse_args()
+
+
+def main():
+    args = parse_args()
+    be = make_backend(args.backend)
+    total = time.perf_counter()
+    result, log = newton_pi(args.digits, be)
+    total = time.perf_counter() - total
+
+    print(f"Backend: {be.name}")
+    print(f"{'iter':>4}{'precision':>12}{'seconds':>11}{'correct':>12}")
+    for i, (prec, seconds, x) in enumerate(log, 1):
+        correct = agreeing_digits(be.to_str(x, min(prec, args.digits)), result)
+        print(f"{i:>4}{prec:>12}{seconds:>11.4f}{correct:>12}")
+    print(f"Total: {total:.3f} s for {args.digits} digits")
+    print(result if args.print else f"{result[:52]}...{result[-10:]}")
+
+    if args.check:
+        ref = machin_digits(args.digits)
+        ok = agreeing_digits(result, ref)
+        print(f"Machin check: {ok} of {args.digits} digits agree"
+              + ("" if ok >= args.digits else " -- MISMATCH"))
+
+
+if __name__ == "__main__":
+    main()
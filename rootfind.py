@@ -0,0 +1,359 @@
+import argparse
+import math
+from collections import namedtuple
+
+import numpy as np
+
+import pinewton
+
+# Root finding with automatic derivatives
+# ---------------------------------------
+# Dual carries (value, first, second derivative) through ordinary NumPy
+# code -- arithmetic and the common ufuncs (np.tan, np.cos, ...) -- so
+# f(Dual.variable(x)) gives f, f' and f'' in one forward pass, element-wise
+# for arrays.  pinewton.f works unchanged; no hand-written df is needed.
+#
+# newton, halley and secant work on scalars or arrays of starting points;
+# brent needs a sign-changing bracket and works on scalars.  Every solver
+# counts values of f and, separately, the derivative values it uses (a Dual
+# call is one f value plus one per derivative order the method needs), and
+# estimates the observed order of convergence from the last steps.  The
+# cost of a run is the sum of both counts.
+
+# python rootfind.py
+# python rootfind.py --function cubic --x0 1.5 --bracket 0 3
+
+Result = namedtuple("Result", "root iterations evals derivs converged order history")
+
+TOLERANCE = 1e-13
+MAX_ITER = 50
+
+
+class Dual:
+    """Truncated second-order Taylor jet: value, d/dx and d2/dx2."""
+
+    __array_priority__ = 1000
+
+    def __init__(self, val, d1=0.0, d2=0.0):
+        self.val = val
+        self.d1 = d1
+        self.d2 = d2
+
+    @classmethod
+    def variable(cls, x):
+        x = np.asarray(x, dtype=np.float64) if not np.isscalar(x) else float(x)
+        return cls(x, np.ones_like(x), np.zeros_like(x))
+
+    @staticmethod
+    def lift(other):
+        return other if isinstance(other, Dual) else Dual(other)
+
+    def chain(self, g, dg, d2g):
+        """Apply a scalar function with value g, g', g'' at self.val."""
+        return Dual(g, dg * self.d1, d2g * self.d1 * self.d1 + dg * self.d2)
+
+    def __add__(self, other):
+        o = Dual.lift(other)
+        return Dual(self.val + o.val, self.d1 + o.d1, self.d2 + o.d2)
+
+    __radd__ = __add__
+
+    def __neg__(self):
+        return Dual(-self.val, -self.d1, -self.d2)
+
+    def __sub__(self, other):
+        return self + -Dual.lift(other)
+
+    def __rsub__(self, other):
+        return Dual.lift(other) + -self
+
+    def __mul__(self, other):
+        o = Dual.lift(other)
+        return Dual(self.val * o.val,
+                    self.d1 * o.val + self.val * o.d1,
+                    self.d2 * o.val + 2 * self.d1 * o.d1 + self.val * o.d2)
+
+    __rmul__ = __mul__
+
+    def reciprocal(self):
+        inv = 1 / self.val
+        return self.chain(inv, -inv * inv, 2 * inv * inv * inv)
+
+    def __truediv__(self, other):
+        if isinstance(other, Dual):
+            return self * other.reciprocal()
+        return Dual(self.val / other, self.d1 / other, self.d2 / other)
+
+    def __rtruediv__(self, other):
+        return Dual.lift(other) * self.reciprocal()
+
+    def __pow__(self, n):
+        if isinstance(n, Dual):
+            return np.exp(n * np.log(self))
+        v = self.val
+        # Skip terms with a zero coefficient (0.0 ** -1 would raise); np.power
+        # gives inf rather than raising for a true singularity like x ** 0.5 at 0
+        d1 = n * np.power(v, n - 1) if n != 0 else 0 * v
+        d2 = n * (n - 1) * np.power(v, n - 2) if n not in (0, 1) else 0 * v
+        return self.chain(v ** n, d1, d2)
+
+    def __rpow__(self, base):
+        return np.exp(self * math.log(base))
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        if method != "__call__" or kwargs:
+            return NotImplemented
+        if ufunc in BINARY:
+            return BINARY[ufunc](*inputs)
+        if ufunc not in UNARY or len(inputs) != 1:
+            return NotImplemented
+        return self.chain(*UNARY[ufunc](self.val))
+
+    def __repr__(self):
+        return f"Dual({self.val!r}, {self.d1!r}, {self.d2!r})"
+
+
+def _tan(v):
+    t = np.tan(v)
+    sec2 = 1 + t * t
+    return t, sec2, 2 * t * sec2
+
+
+def _sqrt(v):
+    s = np.sqrt(v)
+    return s, 0.5 / s, -0.25 / (s * v)
+
+
+# ufunc -> value, first and second derivative at v
+UNARY = {
+    np.sin:     lambda v: (np.sin(v), np.cos(v), -np.sin(v)),
+    np.cos:     lambda v: (np.cos(v), -np.sin(v), -np.cos(v)),
+    np.tan:     _tan,
+    np.exp:     lambda v: (np.exp(v),) * 3,
+    np.log:     lambda v: (np.log(v), 1 / v, -1 / (v * v)),
+    np.sqrt:    _sqrt,
+    np.arctan:  lambda v: (np.arctan(v), 1 / (1 + v * v), -2 * v / (1 + v * v) ** 2),
+    np.sinh:    lambda v: (np.sinh(v), np.cosh(v), np.sinh(v)),
+    np.cosh:    lambda v: (np.cosh(v), np.sinh(v), np.cosh(v)),
+    np.negative: lambda v: (-v, -np.ones_like(v), np.zeros_like(v)),
+    np.square:  lambda v: (v * v, 2 * v, 2 * np.ones_like(v)),
+}
+
+BINARY = {
+    np.add:         lambda a, b: Dual.lift(a) + b,
+    np.subtract:    lambda a, b: Dual.lift(a) - b,
+    np.multiply:    lambda a, b: Dual.lift(a) * b,
+    np.true_divide: lambda a, b: Dual.lift(a) / b,
+    np.power:       lambda a, b: Dual.lift(a) ** b,
+}
+
+
+def derivatives(f, x):
+    """(f(x), f'(x), f''(x)) by forward-mode differentiation."""
+    y = f(Dual.variable(x))
+    if not isinstance(y, Dual):        # f does not depend on x
+        zero = np.zeros_like(np.asarray(y, dtype=np.float64))
+        return y, zero, zero
+    return y.val, y.d1, y.d2
+
+
+class Counted:
+    """Wraps f and counts its values and the derivative values used.
+
+    A Dual argument carries `order` derivatives through f, so that call is
+    charged `order` derivative evaluations on top of the value.
+    """
+
+    def __init__(self, f, order=0):
+        self.f = f
+        self.order = order
+        self.calls = 0
+        self.derivs = 0
+
+    def __call__(self, x):
+        self.calls += 1
+        if isinstance(x, Dual):
+            self.derivs += self.order
+        return self.f(x)
+
+
+def convergence_order(history):
+    """Observed order q from the last three usable step sizes.
+
+    With steps d_k = |x_{k+1} - x_k|, q ≈ log(d_{k+1}/d_k) / log(d_k/d_{k-1}).
+    Steps at rounding level are ignored.  Arrays use the worst element.
+    """
+    xs = [np.atleast_1d(np.asarray(x, dtype=np.float64)) for x in history]
+    steps = [np.abs(b - a) for a, b in zip(xs, xs[1:])]
+    floor = 64 * np.finfo(np.float64).eps * np.maximum(np.abs(xs[-1]), 1.0)
+    order = np.full(xs[-1].shape, np.nan)
+    with np.errstate(all="ignore"):
+        for d0, d1, d2 in zip(steps, steps[1:], steps[2:]):
+            usable = (d2 > floor) & (d1 > d2) & (d0 > d1)
+            q = np.log(d2 / d1) / np.log(d1 / d0)
+            order = np.where(usable, q, order)
+    return float(np.nanmin(order)) if np.any(np.isfinite(order)) else float("nan")
+
+
+def _iterate(f, x0, update, tol, max_iter):
+    x = np.array(x0, dtype=np.float64)
+    history = [x.copy()]
+    converged = np.zeros(x.shape, dtype=bool)
+    it = 0
+    with np.errstate(all="ignore"):
+        while it < max_iter and not np.all(converged):
+            it += 1
+            step = update(x)
+            step = np.where(converged, 0.0, step)
+            x = x - step
+            history.append(x.copy())
+            converged |= np.abs(step) <= tol * np.maximum(np.abs(x), 1.0)
+    root = x if x.ndim else float(x)
+    done = converged if x.ndim else bool(converged)
+    return Result(root, it, f.calls, f.derivs, done, convergence_order(history), history)
+
+
+def newton(f, x0, tol=TOLERANCE, max_iter=MAX_ITER):
+    """Newton's method with the derivative from Dual numbers."""
+    f = Counted(f, order=1)
+
+    def update(x):
+        y, d1, _ = derivatives(f, x)
+        return y / d1
+    return _iterate(f, x0, update, tol, max_iter)
+
+
+def halley(f, x0, tol=TOLERANCE, max_iter=MAX_ITER):
+    """Halley's method (cubic convergence), f' and f'' from one Dual pass."""
+    f = Counted(f, order=2)
+
+    def update(x):
+        y, d1, d2 = derivatives(f, x)
+        return 2 * y * d1 / (2 * d1 * d1 - y * d2)
+    return _iterate(f, x0, update, tol, max_iter)
+
+
+def secant(f, x0, x1=None, tol=TOLERANCE, max_iter=MAX_ITER):
+    """Secant method; no derivatives, one new evaluation per step."""
+    f = Counted(f)
+    x_prev = np.array(x0, dtype=np.float64)
+    x = x_prev + 1e-4 * np.maximum(np.abs(x_prev), 1.0) if x1 is None else np.array(x1, dtype=np.float64)
+    state = {"x": x_prev, "y": f(x_prev)}
+
+    def update(x):
+        y = f(x)
+        slope = (y - state["y"]) / (x - state["x"])
+        state["x"], state["y"] = x, y
+        return np.where(y == 0, 0.0, y / slope)
+
+    res = _iterate(f, x, update, tol, max_iter)
+    return res._replace(history=[x_prev] + res.history,
+                        order=convergence_order([x_prev] + res.history))
+
+
+def brent(f, a, b, tol=TOLERANCE, max_iter=MAX_ITER):
+    """Brent's method on a bracket [a, b] with f(a) f(b) < 0 (scalar only)."""
+    f = Counted(f)
+    fa, fb = float(f(a)), float(f(b))
+    if fa * fb > 0:
+        raise ValueError("brent needs f(a) and f(b) of opposite sign")
+    if abs(fa) < abs(fb):
+        a, b, fa, fb = b, a, fb, fa
+    c, fc, d = a, fa, a
+    bisected = True
+    history = [b]
+    converged = False
+    it = 0
+    while it < max_iter:
+        it += 1
+        if fa != fc and fb != fc:
+            # Inverse quadratic interpolation
+            s = (a * fb * fc / ((fa - fb) * (fa - fc))
+                 + b * fa * fc / ((fb - fa) * (fb - fc))
+                 + c * fa * fb / ((fc - fa) * (fc - fb)))
+        else:
+            s = b - fb * (b - a) / (fb - fa)
+        lo, hi = sorted(((3 * a + b) / 4, b))
+        if (not lo < s < hi
+                or (bisected and abs(s - b) >= abs(b - c) / 2)
+                or (not bisected and abs(s - b) >= abs(c - d) / 2)
+                or (bisected and abs(b - c) < tol)
+                or (not bisected and abs(c - d) < tol)):
+            s = (a + b) / 2
+            bisected = True
+        else:
+            bisected = False
+        fs = float(f(s))
+        d, c, fc = c, b, fb
+        if fa * fs < 0:
+            b, fb = s, fs
+        else:
+            a, fa = s, fs
+        if abs(fa) < abs(fb):
+            a, b, fa, fb = b, a, fb, fa
+        history.append(b)
+        if fb == 0 or abs(b - a) <= tol * max(abs(b), 1.0):
+            converged = True
+            break
+    return Result(b, it, f.calls, f.derivs, converged, convergence_order(history), history)
+
+
+def cubic(x):
+    return x ** 3 - 2 * x - 5
+
+
+# Name -> (f, x0, bracket); pinewton's function needs no derivative here
+FUNCTIONS = {
+    "tan":   (pinewton.f, 3.0, (2.0, 4.0)),
+    "sin":   (np.sin, 3.0, (2.0, 4.0)),
+    "cubic": (cubic, 2.0, (2.0, 3.0)),
+}
+
+
+def cost(result):
+    """Function plus derivative evaluations of a run."""
+    return result.evals + result.derivs
+
+
+def solve_all(f, x0, bracket, tol=TOLERANCE, max_iter=MAX_ITER):
+    """Run every method; returns {name: Result}."""
+    return {
+        "newton": newton(f, x0, tol, max_iter),
+        "halley": halley(f, x0, tol, max_iter),
+        "secant": secant(f, x0, tol=tol, max_iter=max_iter),
+        "brent":  brent(f, *bracket, tol=tol, max_iter=max_iter),
+    }
+
+
+def parse_args():
+    p = argparse.ArgumentParser(description="Compare Newton, Halley, secant and Brent root finders")
+    p.add_argument("--function", default="tan", choices=list(FUNCTIONS), help="Function to solve f(x) = 0")
+    p.add_argument("--x0",       type=float, default=None, help="Starting point (Newton, Halley, secant)")
+    p.add_argument("--bracket",  type=float, nargs=2, default=None, metavar=("A", "B"), help="Bracket for Brent")
+    p.add_argument("--tol",      type=float, default=TOLERANCE, help="Relative step tolerance")
+    p.add_argument("--max-iter", type=int,   default=MAX_ITER, help="Iteration limit")
+    return p.parse_args()
+
+
+def main():
+    args = parse_args()
+    f, x0, bracket = FUNCTIONS[args.function]
+    x0 = x0 if args.x0 is None else args.x0
+    bracket = bracket if args.bracket is None else args.bracket
+    results = solve_all(f, x0, bracket, args.tol, args.max_iter)
+
+    print(f"{'method':<8}{'root':>22}{'error vs PI':>14}{'iters':>7}{'evals':>7}{'derivs':>7}"
+          f"{'cost':>6}{'order':>7}")
+    for name, r in results.items():
+        err = f"{r.root - math.pi:+.2e}" if args.function != "cubic" else "-"
+        print(f"{name:<8}{r.root:>22.16f}{err:>14}{r.iterations:>7}{r.evals:>7}{r.derivs:>7}"
+              f"{cost(r):>6}{r.order:>7.2f}" + ("" if r.converged else "  (not converged)"))
+    best = min(((cost(r), name) for name, r in results.items() if r.converged), default=None)
+    if best is None:
+        print("No method converged")
+    else:
+        print(f"Fewest evaluations (f + derivatives): {best[1]} ({best[0]})")
+
+
+if __name__ == "__main__":
+    main()